@@ -7,10 +7,10 @@ import argparse
 import asyncio
 import concurrent.futures
 from datetime import datetime
-import json
 from json_logging import get_logger
 import logging
 from mqtt_helper import MqttHelper
+import orjson
 import os
 from paho.mqtt.client import Client
 from pathlib import Path
@@ -20,6 +20,17 @@ from typing import Any, Self, cast
 
 from govee2mqtt.interface import GoveeServiceProtocol as Govee2Mqtt
 
+# hold idle Govee API connections longer than a refresh cycle, so each poll reuses one instead of redoing TLS
+HTTP_KEEPALIVE_TIMEOUT = 75
+
+# the Govee API host never moves, so there's no need to re-resolve it every few seconds
+HTTP_DNS_CACHE_TTL = 300
+
+
+def _json_serialize(data: Any) -> str:
+    # aiohttp wants a str back; orjson builds the Govee request bodies much faster than stdlib json
+    return orjson.dumps(data).decode()
+
 
 class Base:
     def __init__(self: Govee2Mqtt, args: argparse.Namespace | None = None, **kwargs: Any) -> None:
@@ -48,30 +59,50 @@ class Base:
 
         self.service = self.mqtt_config["prefix"]
         self.service_name = f"{self.service} service"
+        # identical for every device, built once; each discovery payload takes its own copy since deepmerge merges in place
+        self.device_origin = {
+            "name": self.service_name,
+            "sw": self.config["version"],
+            "support_url": "https://github.com/weirdTangent/govee2mqtt",
+        }
         self.qos = self.mqtt_config["qos"]
+        # state topics are republished every poll, so they default to fire-and-forget
+        self.state_qos = self.mqtt_config.get("state_qos", 0)
+        self.discovery_prefix = self.mqtt_config["discovery_prefix"]
 
         self.mqtt_helper = MqttHelper(self.service, default_qos=self.qos, default_retain=True)
 
         self.running = False
         self.discovery_complete = False
+        self.discovery_complete_event = asyncio.Event()
 
         self.devices: dict[str, Any] = {}
         self.states: dict[str, Any] = {}
-        self.boosted: list[str] = []
+        self.published_states: dict[str, dict[str, Any]] = {}
+        self.device_topics: dict[str, dict[tuple[str, ...], str]] = {}
+        self.service_discovery_payload: bytes | None = None
+        self.device_discovery_payloads: dict[str, bytes] = {}
+        self.saved_state_payload: bytes | None = None
+        self.boosted: set[str] = set()
+        self.boost_event = asyncio.Event()
         self.command_locks: dict[str, asyncio.Lock] = {}
+        self.loop_failures: dict[str, int] = {}
         self._pending_commands: dict[str, dict[str, Any]] = {}
 
         self.mqttc: Client
         self.mqtt_connect_time: datetime
         self.client_id = self.mqtt_helper.client_id()
 
-        self.qos = self.mqtt_config["qos"]
-
         self.device_interval = self.config["govee"].get("device_interval", 30)
+        self.device_interval_max = self.config["govee"].get("device_interval_max", 120)
+        # per-device count of refreshes in a row that changed nothing, and when each device is next due
+        self.device_idle_cycles: dict[str, int] = {}
+        self.device_next_refresh: dict[str, float] = {}
         self.device_boost_interval = self.config["govee"].get("device_boost_interval", 5)
         self.device_list_interval = self.config["govee"].get("device_list_interval", 300)
 
         self.api_key = self.config["govee"]["api_key"]
+        self.api_headers = {"Content-Type": "application/json", "Govee-API-Key": self.api_key}
         self.rate_limited = False
         self.api_calls = 0
         self.last_call_date = datetime.now()
@@ -83,7 +114,8 @@ class Base:
             super_enter()
 
         timeout = aiohttp.ClientTimeout(total=15)
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        connector = aiohttp.TCPConnector(keepalive_timeout=HTTP_KEEPALIVE_TIMEOUT, ttl_dns_cache=HTTP_DNS_CACHE_TTL)
+        self.session = aiohttp.ClientSession(connector=connector, timeout=timeout, json_serialize=_json_serialize)
 
         await cast(Any, self).mqttc_create()
         cast(Any, self).restore_state()
@@ -97,18 +129,16 @@ class Base:
             super_exit(exc_type, exc_val, exc_tb)
 
         self.running = False
-        cast(Any, self).save_state()
+        # a slow SD card shouldn't stall the rest of shutdown on the event loop
+        await asyncio.to_thread(cast(Any, self).save_state)
 
+        # we are still inside the event loop here, so close the shared session for real
+        # instead of scheduling a task that may never run before the loop shuts down
         if cast(Any, self).session and not cast(Any, self).session.closed:
             try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop and loop.is_running():
-                loop.create_task(cast(Any, self).session.close())
-            else:
-                asyncio.run(cast(Any, self).session.close())
+                await cast(Any, self).session.close()
+            except (aiohttp.ClientError, OSError) as e:
+                self.logger.debug(f"http session close failed: {e}")
 
         if cast(Any, self).mqttc is not None:
             try:
@@ -132,19 +162,31 @@ class Base:
             "api_calls": self.api_calls,
             "last_call_date": str(self.last_call_date),
         }
-        fd = os.open(str(data_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        payload = orjson.dumps(state)
+        # the signal handler and shutdown both save, only the first needs to touch the disk,
+        # unless the file went missing since then
+        if payload == self.saved_state_payload and data_file.exists():
+            return
+
+        # write alongside and swap it in, so a crash mid-write never leaves a truncated state file
+        tmp_file = data_file.with_name(f"{data_file.name}.tmp")
+        fd = os.open(str(tmp_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
         os.fchmod(fd, 0o600)
-        with os.fdopen(fd, "w", encoding="utf-8") as file:
-            json.dump(state, file, indent=4)
+        with os.fdopen(fd, "wb") as file:
+            file.write(payload)
+        os.replace(tmp_file, data_file)
+        self.saved_state_payload = payload
         self.logger.info(f"saved state to {data_file}")
 
     def restore_state(self: Govee2Mqtt) -> None:
         data_file = Path(self.config["config_path"]) / "govee2mqtt.dat"
         if os.path.exists(data_file):
             try:
-                with open(data_file, "r", encoding="utf-8") as file:
-                    state = json.loads(file.read())
+                with open(data_file, "rb") as file:
+                    payload = file.read()
+                    state = orjson.loads(payload)
                     self.restore_state_values(state["api_calls"], state["last_call_date"])
+                self.saved_state_payload = payload
                 self.logger.info(f"restored state from {data_file}")
             except (ValueError, KeyError, TypeError, OSError) as err:
                 self.logger.warning(f"could not restore state from {data_file}: {err} — starting fresh")
@@ -2,41 +2,57 @@ import aiohttp
 import asyncio
 from argparse import Namespace
 from asyncio import AbstractEventLoop
+from collections.abc import Awaitable, Callable, Mapping
 from datetime import datetime
 from logging import Logger
 from mqtt_helper import MqttHelper
 from paho.mqtt.client import Client, MQTTMessage
 from paho.mqtt.enums import MQTTProtocolVersion
 from types import FrameType
-from typing import Protocol, Any, Mapping
+from typing import Protocol, Any
 
 
 class GoveeServiceProtocol(Protocol):
     api_calls: int
+    api_headers: dict[str, str]
     api_key: str
     args: Namespace | None
-    boosted: list[str]
+    boosted: set[str]
+    boost_event: asyncio.Event
     client_id: str
     command_locks: dict[str, asyncio.Lock]
     _pending_commands: dict[str, dict[str, Any]]
     config: dict[str, Any]
     device_interval: int
+    device_interval_max: int
     device_list_interval: int
     device_boost_interval: int
+    device_origin: dict[str, str]
     devices: dict[str, Any]
+    device_discovery_payloads: dict[str, bytes]
+    device_idle_cycles: dict[str, int]
+    device_next_refresh: dict[str, float]
+    discovery_prefix: str
+    device_topics: dict[str, dict[tuple[str, ...], str]]
     discovery_complete: bool
+    discovery_complete_event: asyncio.Event
     events: list
     last_call_date: datetime
     logger: Logger
+    loop_failures: dict[str, int]
     loop: AbstractEventLoop
     mqtt_config: dict[str, Any]
     mqtt_connect_time: datetime
     mqtt_helper: MqttHelper
     mqtt_protocol: MQTTProtocolVersion
     mqttc: Client
+    published_states: dict[str, dict[str, Any]]
     qos: int
+    state_qos: int
     rate_limited: bool
     running: bool
+    saved_state_payload: bytes | None
+    service_discovery_payload: bytes | None
     service_name: str
     service: str
     session: aiohttp.ClientSession
@@ -66,14 +82,17 @@ class GoveeServiceProtocol(Protocol):
     async def prepare_device(self, device: dict[str, Any], raw_id: str, device_id: str, type: str) -> None: ...
     async def publish_device_availability(self, device_id: str, online: bool = True) -> None: ...
     async def publish_device_discovery(self, device_id: str) -> None: ...
-    async def publish_device_state(self, device_id: str) -> None: ...
+    async def publish_device_state(self, device_id: str, subject: str = "", sub: str = "") -> bool: ...
     async def publish_service_availability(self, status: str = "online") -> None: ...
     async def publish_service_discovery(self) -> None: ...
     async def publish_service_state(self) -> None: ...
-    async def rediscover_all(self) -> None: ...
+    async def publish_state_messages(self, updates: dict[str, list[tuple[str, Any]]]) -> None: ...
+    async def rediscover_all(self, device_discovery: bool = True) -> None: ...
     async def refresh_all_devices(self) -> None: ...
     async def refresh_boosted_devices(self) -> None: ...
+    async def refresh_device(self, device_id: str) -> bool: ...
     async def refresh_device_list(self) -> None: ...
+    async def run_loop_step(self, name: str, step: Callable[[], Awaitable[None]]) -> None: ...
     async def send_command(self, device_id: str, attribute: str, command: Any) -> None: ...
 
     def _assert_no_tuples(self, data: Any, path: str = "root") -> None: ...
@@ -82,12 +101,17 @@ class GoveeServiceProtocol(Protocol):
     def _normalize_color_key(self, key: str) -> str: ...
     async def _send_single_command(self, device_id: str, attribute: str, command: Any) -> None: ...
     def _handle_signal(self, signum: int, frame: FrameType | None = None) -> None: ...
+    def _publish_batch(self, messages: list[tuple[str, Any]]) -> None: ...
     def build_govee_capabilities(self, device_id: str, attribute: str, payload: Any) -> dict[str, dict]: ...
     def build_light_components(self, device_id: str, light: dict[str, Any], scenes: list[dict[str, Any]] | None = None) -> dict[str, dict[str, Any]]: ...
+    def build_service_discovery_payload(self) -> bytes: ...
     def classify_device(self, device: dict[str, Any]) -> str: ...
     def find_key_by_value(self, d: Mapping[Any, Any], target: Any) -> Any: ...
     def get_device_name(self, device_id: str) -> str: ...
+    def get_device_refresh_interval(self, device_id: str) -> int: ...
     def get_device_sku(self, device_id: str) -> str: ...
+    def get_device_state_messages(self, device_id: str, subject: str = "", sub: str = "") -> list[tuple[str, Any]]: ...
+    def get_device_topic(self, device_id: str, kind: str, *parts: str) -> str: ...
     def get_headers(self) -> dict[str, str]: ...
     def get_raw_id(self, device_id: str) -> str: ...
     def heartbeat_ready(self) -> None: ...
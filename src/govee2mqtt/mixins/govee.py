@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from functools import cache
 import re
 
 from typing import TYPE_CHECKING, Any
@@ -21,6 +22,60 @@ SKU_CLASS_PATTERNS: list[tuple[re.Pattern[str], str]] = [
     (re.compile(r"^H5\d{2,}[A-Z]*$"), "sensor"),
 ]
 
+# light capabilities that each add a color mode to the light, plus its state/command topic pair:
+# instance -> (color mode, light state key)
+LIGHT_COLOR_CAPABILITIES: dict[str, tuple[str, str]] = {
+    "brightness": ("brightness", "brightness"),
+    "colorRgb": ("rgb", "rgb_color"),
+    "colorTemperatureK": ("color_temp", "color_temp"),
+}
+
+# sensor capabilities we expose: instance -> (device id suffix, component key, static component fields);
+# the templates only hold immutable values so they can be shallow-copied into each device
+SENSOR_COMPONENTS: dict[str, tuple[str, str, dict[str, Any]]] = {
+    "sensorTemperature": (
+        "temp",
+        "temperature",
+        {
+            "p": "sensor",
+            "name": "Temperature",
+            "device_class": "temperature",
+            "state_class": "measurement",
+            "unit_of_measurement": "°F",
+            "icon": "mdi:thermometer",
+        },
+    ),
+    "sensorHumidity": (
+        "hmdy",
+        "humidity",
+        {
+            "p": "sensor",
+            "name": "Humidity",
+            "device_class": "humidity",
+            "state_class": "measurement",
+            "unit_of_measurement": "%",
+            "icon": "mdi:water-percent",
+        },
+    ),
+}
+
+
+@cache
+def _classify_sku(sku: str) -> str:
+    # every device of the same SKU classifies the same way, so only walk the patterns once per SKU
+    for pattern, device_class in SKU_CLASS_PATTERNS:
+        if pattern.match(sku):
+            return device_class
+    return ""
+
+
+def _music_mode_labels(music_mode_values: dict[str, int]) -> dict[int, str]:
+    # value -> name, keeping the first name for a shared value the way a front-to-back search would
+    labels: dict[int, str] = {}
+    for name, value in music_mode_values.items():
+        labels.setdefault(value, name)
+    return labels
+
 
 class GoveeMixin:
     async def refresh_device_list(self: Govee2Mqtt) -> None:
@@ -52,9 +107,12 @@ class GoveeMixin:
         # Handle first discovery completion
         if not self.discovery_complete:
             await asyncio.sleep(5)
-            await self.rediscover_all()
+            # prepare_device already sent discovery for every new device, so only the service
+            # still needs announcing; states go out once more now that HA has subscribed
+            await self.rediscover_all(device_discovery=False)
             self.logger.info("first-time device setup and discovery is done")
             self.discovery_complete = True
+            self.discovery_complete_event.set()
 
     # convert Govee device capabilities into MQTT components
     async def build_component(self: Govee2Mqtt, device: dict[str, Any]) -> str:
@@ -83,9 +141,9 @@ class GoveeMixin:
     def classify_device(self: Govee2Mqtt, device: dict[str, Any]) -> str:
         sku = device["sku"]
 
-        for pattern, device_class in SKU_CLASS_PATTERNS:
-            if pattern.match(sku):
-                return device_class
+        device_class = _classify_sku(sku)
+        if device_class:
+            return device_class
 
         # If we reach here, it's unsupported — log details (the first time) for future handling
         if not self.discovery_complete:
@@ -167,8 +225,8 @@ class GoveeMixin:
                 "p": "switch",
                 "name": "Power",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "air_purifier"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "switch", "power"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "power"),
+                "stat_t": self.get_device_topic(device_id, "stat", "switch", "power"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "power"),
                 "device_class": "switch",
                 "icon": "mdi:power",
             }
@@ -180,8 +238,8 @@ class GoveeMixin:
                 "p": "select",
                 "name": "Work Mode",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "work_mode"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "select", "work_mode"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "select", "work_mode"),
+                "stat_t": self.get_device_topic(device_id, "stat", "select", "work_mode"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "select", "work_mode"),
                 "options": work_mode_options,
                 "icon": "mdi:air-purifier",
             }
@@ -193,7 +251,7 @@ class GoveeMixin:
                 "p": "sensor",
                 "name": "Filter Life",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "filter_life"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "sensor", "filter_life"),
+                "stat_t": self.get_device_topic(device_id, "stat", "sensor", "filter_life"),
                 "unit_of_measurement": "%",
                 "state_class": "measurement",
                 "entity_category": "diagnostic",
@@ -205,7 +263,7 @@ class GoveeMixin:
                 "p": "sensor",
                 "name": "Air Quality",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "air_quality"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "sensor", "air_quality"),
+                "stat_t": self.get_device_topic(device_id, "stat", "sensor", "air_quality"),
                 "device_class": "aqi",
                 "icon": "mdi:air-purifier",
             }
@@ -289,8 +347,8 @@ class GoveeMixin:
             "p": "switch",
             "name": "Power",
             "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "humidifier"),
-            "stat_t": self.mqtt_helper.stat_t(device_id, "switch", "power"),
-            "cmd_t": self.mqtt_helper.cmd_t(device_id, "power"),
+            "stat_t": self.get_device_topic(device_id, "stat", "switch", "power"),
+            "cmd_t": self.get_device_topic(device_id, "cmd", "power"),
             "device_class": "switch",
             "icon": "mdi:power",
         }
@@ -305,8 +363,8 @@ class GoveeMixin:
                 "p": "number",
                 "name": "Humidity",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "humidity"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "number", "humidity"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "number", "humidity"),
+                "stat_t": self.get_device_topic(device_id, "stat", "number", "humidity"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "number", "humidity"),
                 "min": min_humidity,
                 "max": max_humidity,
                 "step": 1,
@@ -323,8 +381,8 @@ class GoveeMixin:
                 "p": "switch",
                 "name": "Warm Mist",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "switch"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "switch", "warm_mist"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "switch", "warm_mist"),
+                "stat_t": self.get_device_topic(device_id, "stat", "switch", "warm_mist"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "switch", "warm_mist"),
                 "device_class": "switch",
                 "icon": "mdi:heat-wave",
             }
@@ -335,8 +393,8 @@ class GoveeMixin:
                 "p": "select",
                 "name": "Work Mode",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "work_mode"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "select", "work_mode"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "select", "work_mode"),
+                "stat_t": self.get_device_topic(device_id, "stat", "select", "work_mode"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "select", "work_mode"),
                 "options": work_mode_options,
                 "icon": "mdi:water-pump",
             }
@@ -348,8 +406,8 @@ class GoveeMixin:
                 "p": "select",
                 "name": "Nightlight Scene",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "nightlight_scene"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "select", "nightlight_scene"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "light", "nightlight_scene"),
+                "stat_t": self.get_device_topic(device_id, "stat", "select", "nightlight_scene"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "light", "nightlight_scene"),
                 "options": nightlight_options,
                 "icon": "mdi:weather-night",
             }
@@ -374,81 +432,41 @@ class GoveeMixin:
         parent = raw_id.replace(":", "").upper()
 
         for cap in sensor["capabilities"]:
-            device_id = None
-            device = None
-            match cap["instance"]:
-                case "sensorTemperature":
-                    device_id = f"{parent}_temp"
-                    device = {
-                        "stat_t": self.mqtt_helper.stat_t(parent, "sensor"),
-                        "avty_t": self.mqtt_helper.avty_t(parent, "sensor"),
-                        "device": {
-                            "name": sensor["deviceName"],
-                            "identifiers": [
-                                self.mqtt_helper.device_slug(device_id),
-                            ],
-                            "manufacturer": "Govee",
-                            "model": sensor["sku"],
-                            "connections": [
-                                ["mac", sensor["device"]],
-                            ],
-                            "via_device": self.service,
-                        },
-                        "origin": {"name": self.service_name, "sw": self.config["version"], "support_url": "https://github.com/weirdTangent/govee2mqtt"},
-                        "qos": self.qos,
-                        "cmps": {
-                            "temperature": {
-                                "p": "sensor",
-                                "name": "Temperature",
-                                "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "temperature"),
-                                "stat_t": self.mqtt_helper.stat_t(parent, "sensor"),
-                                "device_class": "temperature",
-                                "state_class": "measurement",
-                                "unit_of_measurement": "°F",
-                                "icon": "mdi:thermometer",
-                            }
-                        },
-                    }
+            sensor_component = SENSOR_COMPONENTS.get(cap["instance"])
+            if not sensor_component:
+                continue
 
-                case "sensorHumidity":
-                    device_id = f"{parent}_hmdy"
-                    device = {
-                        "stat_t": self.mqtt_helper.stat_t(parent, "sensor"),
-                        "avty_t": self.mqtt_helper.avty_t(parent, "sensor"),
-                        "device": {
-                            "name": sensor["deviceName"],
-                            "identifiers": [
-                                self.mqtt_helper.device_slug(device_id),
-                            ],
-                            "manufacturer": "Govee",
-                            "model": sensor["sku"],
-                            "connections": [
-                                ["mac", sensor["device"]],
-                            ],
-                            "via_device": self.service,
-                        },
-                        "origin": {"name": self.service_name, "sw": self.config["version"], "support_url": "https://github.com/weirdTangent/govee2mqtt"},
-                        "qos": self.qos,
-                        "cmps": {
-                            "humidity": {
-                                "p": "sensor",
-                                "name": "Humidity",
-                                "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "humidity"),
-                                "stat_t": self.mqtt_helper.stat_t(parent, "sensor"),
-                                "device_class": "humidity",
-                                "state_class": "measurement",
-                                "unit_of_measurement": "%",
-                                "icon": "mdi:water-percent",
-                            }
-                        },
+            suffix, component_key, template = sensor_component
+            device_id = f"{parent}_{suffix}"
+            device = {
+                "stat_t": self.get_device_topic(parent, "stat", "sensor"),
+                "avty_t": self.get_device_topic(parent, "avty", "sensor"),
+                "device": {
+                    "name": sensor["deviceName"],
+                    "identifiers": [
+                        self.mqtt_helper.device_slug(device_id),
+                    ],
+                    "manufacturer": "Govee",
+                    "model": sensor["sku"],
+                    "connections": [
+                        ["mac", sensor["device"]],
+                    ],
+                    "via_device": self.service,
+                },
+                "origin": dict(self.device_origin),
+                "qos": self.qos,
+                "cmps": {
+                    component_key: {
+                        **template,
+                        "uniq_id": self.mqtt_helper.dev_unique_id(device_id, component_key),
+                        "stat_t": self.get_device_topic(parent, "stat", "sensor"),
                     }
-                case _:
-                    continue
+                },
+            }
 
-            if device_id:
-                self.upsert_state(device_id, internal={"raw_id": raw_id, "sku": sensor.get("sku")})
-                await self.prepare_device(device, raw_id, device_id, sensor["deviceName"])
-                return device_id
+            self.upsert_state(device_id, internal={"raw_id": raw_id, "sku": sensor.get("sku")})
+            await self.prepare_device(device, raw_id, device_id, sensor["deviceName"])
+            return device_id
 
         return ""
 
@@ -466,9 +484,9 @@ class GoveeMixin:
                 "p": "light",
                 "name": light_component_name,
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "light"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "light", "state"),
-                "avty_t": self.mqtt_helper.avty_t(device_id),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "light"),
+                "stat_t": self.get_device_topic(device_id, "stat", "light", "state"),
+                "avty_t": self.get_device_topic(device_id, "avty"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "light"),
                 "supported_color_modes": ["onoff"],
             },
         }
@@ -488,35 +506,35 @@ class GoveeMixin:
         music_rgb_supported = False
         has_music_capability = False
 
+        light_component = components["light"]
+
         # adjust our light component based on what this Govee light can support
         for cap in light["capabilities"]:
-            match cap["instance"]:
+            instance = cap["instance"]
+            if color_capability := LIGHT_COLOR_CAPABILITIES.get(instance):
+                color_mode, state_key = color_capability
+                light_component["supported_color_modes"].append(color_mode)
+                light_component[f"{color_mode}_state_topic"] = self.get_device_topic(device_id, "stat", "light", state_key)
+                light_component[f"{color_mode}_command_topic"] = self.get_device_topic(device_id, "cmd", "light", state_key)
+
+            match instance:
                 case "brightness":
-                    components["light"]["supported_color_modes"].append("brightness")
-                    components["light"]["brightness_scale"] = cap["parameters"]["range"]["max"]
-                    components["light"]["brightness_state_topic"] = self.mqtt_helper.stat_t(device_id, "light", "brightness")
-                    components["light"]["brightness_command_topic"] = self.mqtt_helper.cmd_t(device_id, "light", "brightness")
+                    light_component["brightness_scale"] = cap["parameters"]["range"]["max"]
                 case "powerSwitch":
-                    components["light"]["supported_color_modes"].append("onoff")
+                    light_component["supported_color_modes"].append("onoff")
                 case "colorRgb":
-                    components["light"]["supported_color_modes"].append("rgb")
-                    components["light"]["rgb_state_topic"] = self.mqtt_helper.stat_t(device_id, "light", "rgb_color")
-                    components["light"]["rgb_command_topic"] = self.mqtt_helper.cmd_t(device_id, "light", "rgb_color")
                     self.upsert_state(device_id, light={"rgb_max": cap["parameters"]["range"]["max"] or 16777215})
                 case "colorTemperatureK":
-                    components["light"]["supported_color_modes"].append("color_temp")
-                    components["light"]["color_temp_kelvin"] = True
-                    components["light"]["color_temp_state_topic"] = self.mqtt_helper.stat_t(device_id, "light", "color_temp")
-                    components["light"]["color_temp_command_topic"] = self.mqtt_helper.cmd_t(device_id, "light", "color_temp")
-                    components["light"]["min_kelvin"] = cap["parameters"]["range"]["min"] or 2000
-                    components["light"]["max_kelvin"] = cap["parameters"]["range"]["max"] or 9000
+                    light_component["color_temp_kelvin"] = True
+                    light_component["min_kelvin"] = cap["parameters"]["range"]["min"] or 2000
+                    light_component["max_kelvin"] = cap["parameters"]["range"]["max"] or 9000
                 case "gradientToggle":
                     components["gradient"] = {
                         "p": "switch",
                         "name": "Gradient",
                         "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "gradient"),
-                        "stat_t": self.mqtt_helper.stat_t(device_id, "switch", "gradient"),
-                        "cmd_t": self.mqtt_helper.cmd_t(device_id, "switch", "gradient"),
+                        "stat_t": self.get_device_topic(device_id, "stat", "switch", "gradient"),
+                        "cmd_t": self.get_device_topic(device_id, "cmd", "switch", "gradient"),
                         "icon": ("mdi:gradient-horizontal" if light["sku"] == "H6042" else "mdi:gradient-vertical"),
                     }
                     self.upsert_state(device_id, switch={"gradient": "OFF"})
@@ -527,8 +545,8 @@ class GoveeMixin:
                         "p": "switch",
                         "name": "Dreamview",
                         "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "dreamview"),
-                        "stat_t": self.mqtt_helper.stat_t(device_id, "switch", "dreamview"),
-                        "cmd_t": self.mqtt_helper.cmd_t(device_id, "switch", "dreamview"),
+                        "stat_t": self.get_device_topic(device_id, "stat", "switch", "dreamview"),
+                        "cmd_t": self.get_device_topic(device_id, "cmd", "switch", "dreamview"),
                         "icon": "mdi:creation",
                     }
                     # Don't set initial state - let build_device_states query actual state from API
@@ -617,16 +635,16 @@ class GoveeMixin:
 
         # If a light supports a color mode (rgb or color_temp), drop simpler color modes
         # but keep brightness topics so HA can control brightness in color_temp mode
-        cmpset = set(components["light"]["supported_color_modes"])
+        cmpset = set(light_component["supported_color_modes"])
         if "rgb" in cmpset or "color_temp" in cmpset:
             cmpset.discard("onoff")
             cmpset.discard("brightness")
-        components["light"]["supported_color_modes"] = list(cmpset)
+        light_component["supported_color_modes"] = list(cmpset)
 
         # if light really is a nightlight, rename it and move it to the nightlight component
         if light_is_nightlight:
-            components["light"]["name"] = "Nightlight"
-            components["light"]["uniq_id"] = self.mqtt_helper.dev_unique_id(device_id, "nightlight")
+            light_component["name"] = "Nightlight"
+            light_component["uniq_id"] = self.mqtt_helper.dev_unique_id(device_id, "nightlight")
             components["nightlight"] = components.pop("light")
 
         dynamic_scene_labels_internal: dict[str, dict[Any, str]] = {}
@@ -649,8 +667,8 @@ class GoveeMixin:
                 "p": "select",
                 "name": scene_name,
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, scene_key),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "select", scene_key),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "select", scene_key),
+                "stat_t": self.get_device_topic(device_id, "stat", "select", scene_key),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "select", scene_key),
                 "options": options_list,
                 "icon": "mdi:movie-open-outline",
             }
@@ -672,8 +690,8 @@ class GoveeMixin:
                 "p": "select",
                 "name": "Segment",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "segment_index"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "select", "segment_index"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "select", "segment_index"),
+                "stat_t": self.get_device_topic(device_id, "stat", "select", "segment_index"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "select", "segment_index"),
                 "options": segment_options,
                 "icon": "mdi:animation-outline",
             }
@@ -695,8 +713,8 @@ class GoveeMixin:
                     "p": "number",
                     "name": "Segment Brightness",
                     "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "segment_brightness"),
-                    "stat_t": self.mqtt_helper.stat_t(device_id, "number", "segment_brightness"),
-                    "cmd_t": self.mqtt_helper.cmd_t(device_id, "number", "segment_brightness"),
+                    "stat_t": self.get_device_topic(device_id, "stat", "number", "segment_brightness"),
+                    "cmd_t": self.get_device_topic(device_id, "cmd", "number", "segment_brightness"),
                     "min": brightness_min,
                     "max": brightness_max,
                     "step": brightness_step,
@@ -718,8 +736,8 @@ class GoveeMixin:
                     "p": "number",
                     "name": "Segment RGB",
                     "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "segment_rgb"),
-                    "stat_t": self.mqtt_helper.stat_t(device_id, "number", "segment_rgb"),
-                    "cmd_t": self.mqtt_helper.cmd_t(device_id, "number", "segment_rgb"),
+                    "stat_t": self.get_device_topic(device_id, "stat", "number", "segment_rgb"),
+                    "cmd_t": self.get_device_topic(device_id, "cmd", "number", "segment_rgb"),
                     "min": color_min,
                     "max": color_max,
                     "step": 1,
@@ -739,8 +757,8 @@ class GoveeMixin:
                 "p": "select",
                 "name": "Music Mode",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "music_mode"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "select", "music_mode"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "music_mode"),
+                "stat_t": self.get_device_topic(device_id, "stat", "select", "music_mode"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "music_mode"),
                 "options": music_mode_options,
                 "icon": "mdi:music-note",
             }
@@ -754,8 +772,8 @@ class GoveeMixin:
                 "p": "number",
                 "name": "Music Sensitivity",
                 "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "music_sensitivity"),
-                "stat_t": self.mqtt_helper.stat_t(device_id, "number", "music_sensitivity"),
-                "cmd_t": self.mqtt_helper.cmd_t(device_id, "music_sensitivity"),
+                "stat_t": self.get_device_topic(device_id, "stat", "number", "music_sensitivity"),
+                "cmd_t": self.get_device_topic(device_id, "cmd", "music_sensitivity"),
                 "min": sensitivity_min,
                 "max": sensitivity_max,
                 "step": sensitivity_step,
@@ -769,8 +787,8 @@ class GoveeMixin:
                     "p": "switch",
                     "name": "Music Auto Color",
                     "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "music_auto_color"),
-                    "stat_t": self.mqtt_helper.stat_t(device_id, "switch", "music_auto_color"),
-                    "cmd_t": self.mqtt_helper.cmd_t(device_id, "music_auto_color"),
+                    "stat_t": self.get_device_topic(device_id, "stat", "switch", "music_auto_color"),
+                    "cmd_t": self.get_device_topic(device_id, "cmd", "music_auto_color"),
                     "icon": "mdi:palette",
                 }
 
@@ -779,8 +797,8 @@ class GoveeMixin:
                     "p": "number",
                     "name": "Music RGB Value",
                     "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "music_rgb"),
-                    "stat_t": self.mqtt_helper.stat_t(device_id, "number", "music_rgb"),
-                    "cmd_t": self.mqtt_helper.cmd_t(device_id, "music_rgb"),
+                    "stat_t": self.get_device_topic(device_id, "stat", "number", "music_rgb"),
+                    "cmd_t": self.get_device_topic(device_id, "cmd", "music_rgb"),
                     "min": music_rgb_range["min"],
                     "max": music_rgb_range["max"],
                     "step": 1,
@@ -828,6 +846,9 @@ class GoveeMixin:
             internal_updates["dynamic_scene_instances"] = dynamic_scene_instances_map
         if dynamic_scene_components_map:
             internal_updates["dynamic_scene_components"] = dynamic_scene_components_map
+        if has_music_capability and music_mode_values:
+            # musicMode updates report the numeric value, so keep the value -> name direction ready
+            internal_updates["music_mode_labels"] = _music_mode_labels(music_mode_values)
 
         # Add light_scene select component if scenes were fetched from the API
         if scenes:
@@ -849,8 +870,8 @@ class GoveeMixin:
                     "p": "select",
                     "name": "Light Scene",
                     "uniq_id": self.mqtt_helper.dev_unique_id(device_id, "light_scene"),
-                    "stat_t": self.mqtt_helper.stat_t(device_id, "select", "light_scene"),
-                    "cmd_t": self.mqtt_helper.cmd_t(device_id, "select", "light_scene"),
+                    "stat_t": self.get_device_topic(device_id, "stat", "select", "light_scene"),
+                    "cmd_t": self.get_device_topic(device_id, "cmd", "select", "light_scene"),
                     "options": api_scene_options,
                     "icon": "mdi:palette",
                 }
@@ -878,8 +899,8 @@ class GoveeMixin:
 
 def _build_device_payload(service: "Govee2Mqtt", device_id: str, source: dict[str, Any], domain: str, components: dict[str, Any]) -> dict[str, Any]:
     return {
-        "stat_t": service.mqtt_helper.stat_t(device_id, domain),
-        "avty_t": service.mqtt_helper.avty_t(device_id),
+        "stat_t": service.get_device_topic(device_id, "stat", domain),
+        "avty_t": service.get_device_topic(device_id, "avty"),
         "device": {
             "name": source["deviceName"],
             "identifiers": [
@@ -892,11 +913,7 @@ def _build_device_payload(service: "Govee2Mqtt", device_id: str, source: dict[st
             ],
             "via_device": service.service,
         },
-        "origin": {
-            "name": service.service_name,
-            "sw": service.config["version"],
-            "support_url": "https://github.com/weirdTangent/govee2mqtt",
-        },
+        "origin": dict(service.device_origin),
         "qos": service.qos,
         "cmps": components,
     }
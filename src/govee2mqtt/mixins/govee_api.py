@@ -2,11 +2,11 @@
 # Copyright (c) 2025 Jeff Culverhouse
 from __future__ import annotations
 
-import json
-
 import aiohttp
 from aiohttp import ClientError
 from datetime import datetime
+import logging
+import orjson
 import uuid
 
 from typing import TYPE_CHECKING, Any
@@ -37,7 +37,8 @@ class GoveeAPIMixin:
             self.logger.warning("request rate-limited by Govee")
 
     def get_headers(self: Govee2Mqtt) -> dict[str, str]:
-        return {"Content-Type": "application/json", "Govee-API-Key": self.api_key}
+        # the key never changes at runtime, so every request shares the headers built in __init__
+        return self.api_headers
 
     async def get_device_list(self: Govee2Mqtt) -> list[dict[str, Any]]:
         headers = self.get_headers()
@@ -51,9 +52,9 @@ class GoveeAPIMixin:
                     self.logger.error(f"error ({r.status}) getting device list")
                     return []
 
-                data = await r.json(content_type=None)
+                data = await r.json(content_type=None, loads=orjson.loads)
 
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             self.logger.error(f"invalid JSON response from Govee for device list: {err}")
             return []
         except ClientError as err:
@@ -74,7 +75,10 @@ class GoveeAPIMixin:
         return result
 
     async def get_device(self: Govee2Mqtt, device_id: str) -> dict[str, Any]:
-        self.logger.debug(f"getting device '{self.get_device_name(device_id)}' ({device_id}) from Govee")
+        # this runs for every device on every poll; don't build debug strings (incl. the raw response) for nothing
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            self.logger.debug(f"getting device '{self.get_device_name(device_id)}' ({device_id}) from Govee")
 
         headers = self.get_headers()
         body = {
@@ -94,10 +98,11 @@ class GoveeAPIMixin:
                     self.logger.error(f"error ({r.status}) getting device '{self.get_device_name(device_id)}'")
                     return {}
 
-                data = await r.json(content_type=None)
-                self.logger.debug(f"raw API response for '{self.get_device_name(device_id)}': {data}")
+                data = await r.json(content_type=None, loads=orjson.loads)
+                if debug_enabled:
+                    self.logger.debug(f"raw API response for '{self.get_device_name(device_id)}': {data}")
 
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             self.logger.error(f"invalid JSON response from Govee for device '{self.get_device_name(device_id)}': {err}")
             return {}
         except aiohttp.ClientError as err:
@@ -115,7 +120,8 @@ class GoveeAPIMixin:
         for capability in data.get("payload", {}).get("capabilities", []):
             new_capabilities[capability["instance"]] = capability["state"]["value"]
 
-        self.logger.debug(f"device '{self.get_device_name(device_id)}' state from Govee API: {new_capabilities}")
+        if debug_enabled:
+            self.logger.debug(f"device '{self.get_device_name(device_id)}' state from Govee API: {new_capabilities}")
         return new_capabilities
 
     async def get_device_scenes(self: Govee2Mqtt, device_id: str) -> list[dict[str, Any]]:
@@ -140,9 +146,9 @@ class GoveeAPIMixin:
                     self.logger.debug(f"error ({r.status}) getting scenes for device ({device_id})")
                     return []
 
-                data = await r.json(content_type=None)
+                data = await r.json(content_type=None, loads=orjson.loads)
 
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             self.logger.debug(f"invalid JSON response getting scenes for device ({device_id}): {err}")
             return []
         except aiohttp.ClientError as err:
@@ -190,9 +196,9 @@ class GoveeAPIMixin:
                 if r.status != 200:
                     return {}
 
-                data = await r.json(content_type=None)
+                data = await r.json(content_type=None, loads=orjson.loads)
 
-        except json.JSONDecodeError as err:
+        except orjson.JSONDecodeError as err:
             self.logger.error(f"invalid JSON response from Govee sending command to device '{self.get_device_name(device_id)}': {err}")
             return {}
         except ClientError as err:
@@ -211,8 +217,7 @@ class GoveeAPIMixin:
             if "capability" in data and "state" in data["capability"] and data["capability"]["state"]["status"] == "success":
                 capability = data["capability"]
                 if isinstance(capability["value"], dict):
-                    for key in capability["value"]:
-                        new_capabilities[key] = capability["value"][key]
+                    new_capabilities.update(capability["value"])
                 else:
                     new_capabilities[capability["instance"]] = capability["value"]
         except Exception:
@@ -27,6 +27,29 @@ READY_FILE = os.getenv("READY_FILE", "/tmp/govee2mqtt.ready")
 # we collect them and keep only the one that arrived last.
 COLOR_MODE_BATCH_WINDOW = 0.1
 
+# toggle states where 0 (OFF) is a real value and must not be skipped
+TOGGLE_STATE_KEYS = frozenset({"dreamViewToggle", "gradientToggle", "nightlightToggle", "warmMistToggle"})
+
+# mutually exclusive light modes, mapped to their Govee capability instance names (camelCase)
+LIGHT_MODE_TOGGLES = {
+    "gradient": "gradientToggle",
+    "nightlight": "nightlightToggle",
+    "dreamview": "dreamViewToggle",
+}
+
+# (winner, loser) pairs: Govee will not take the loser in the same batch as the winner
+CAPABILITY_SUBSUMES = (
+    ("brightness", "turn"),
+    ("color", "turn"),
+)
+
+# Govee state keys stored as-is, mapped to their (state group, state key); checked before the match below
+DIRECT_STATE_KEYS = {
+    "brightness": ("light", "brightness"),
+    "sensorTemperature": ("sensor", "temperature"),
+    "sensorHumidity": ("sensor", "humidity"),
+}
+
 
 class HelpersMixin:
     async def build_device_states(self: Govee2Mqtt, device_id: str, data: dict[str, Any] = {}) -> None:
@@ -34,17 +57,23 @@ class HelpersMixin:
             data = await self.get_device(device_id)
         component = self.devices[device_id]["component"]
 
-        for key in data:
+        for key, value in data.items():
             # Don't skip toggle states even when they're 0 (OFF)
-            if data[key] is None or (not data[key] and key not in {"dreamViewToggle", "gradientToggle", "nightlightToggle", "warmMistToggle"}):
+            if value is None or (not value and key not in TOGGLE_STATE_KEYS):
+                continue
+
+            direct = DIRECT_STATE_KEYS.get(key)
+            if direct:
+                group, state_key = direct
+                self.upsert_state(device_id, **{group: {state_key: value}})
                 continue
 
             match key:
                 case "online":
-                    self.upsert_state(device_id, availability="online" if data[key] else "offline")
+                    self.upsert_state(device_id, availability="online" if value else "offline")
 
                 case "powerSwitch":
-                    power_on = data[key] == 1
+                    power_on = value == 1
                     if "power" in component["cmps"]:
                         self.upsert_state(device_id, switch={"power": "ON" if power_on else "OFF"})
                     elif "light" in component["cmps"]:
@@ -53,14 +82,11 @@ class HelpersMixin:
                         if not power_on and "dreamview" in component["cmps"]:
                             self.upsert_state(device_id, switch={"dreamview": "OFF"})
 
-                case "brightness":
-                    self.upsert_state(device_id, light={"brightness": data[key]})
-
                 case "humidity":
-                    self.upsert_state(device_id, number={"humidity": int(data[key])})
+                    self.upsert_state(device_id, number={"humidity": int(value)})
 
                 case "colorRgb":
-                    rgb_int = data[key]
+                    rgb_int = value
                     self.upsert_state(
                         device_id,
                         light={
@@ -74,7 +100,6 @@ class HelpersMixin:
 
                 case "colorTemperatureK":
                     # restrict color_temp to be >= min and <= max
-                    value = data[key]
                     if isinstance(value, str):
                         value = int(value)
                     color = min(max(value, component["cmps"]["light"]["min_kelvin"]), component["cmps"]["light"]["max_kelvin"])
@@ -82,21 +107,21 @@ class HelpersMixin:
 
                 case "gradientToggle":
                     # Only update state if we have a definitive value (0 or 1), not empty string
-                    if data[key] in (0, 1):
-                        self.upsert_state(device_id, switch={"gradient": "ON" if data[key] == 1 else "OFF"}, light={"state": "ON" if data[key] == 1 else "OFF"})
+                    if value in (0, 1):
+                        self.upsert_state(device_id, switch={"gradient": "ON" if value == 1 else "OFF"}, light={"state": "ON" if value == 1 else "OFF"})
 
                 case "nightlightToggle":
                     # Only update state if we have a definitive value (0 or 1), not empty string
-                    if data[key] in (0, 1):
-                        self.upsert_state(device_id, light={"state": "ON" if data[key] == 1 else "OFF"})
+                    if value in (0, 1):
+                        self.upsert_state(device_id, light={"state": "ON" if value == 1 else "OFF"})
 
                 case "warmMistToggle":
                     # Only update state if we have a definitive value (0 or 1), not empty string
-                    if data[key] in (0, 1):
-                        self.upsert_state(device_id, switch={"warm_mist": "ON" if data[key] == 1 else "OFF"})
+                    if value in (0, 1):
+                        self.upsert_state(device_id, switch={"warm_mist": "ON" if value == 1 else "OFF"})
 
                 case "nightlightScene":
-                    scene_value = data[key]
+                    scene_value = value
                     internal = self.states.get(device_id, {}).get("internal", {})
                     scene_labels = internal.get("nightlight_scene_labels", {})
                     scene_selection: str | None = None
@@ -112,17 +137,11 @@ class HelpersMixin:
                 case "dreamViewToggle":
                     self.upsert_state(
                         device_id,
-                        switch={"dreamview": "ON" if data[key] == 1 else "OFF"},
+                        switch={"dreamview": "ON" if value == 1 else "OFF"},
                     )
 
-                case "sensorTemperature":
-                    self.upsert_state(device_id, sensor={"temperature": data[key]})
-
-                case "sensorHumidity":
-                    self.upsert_state(device_id, sensor={"humidity": data[key]})
-
                 case "filterLifeTime":
-                    lifetime_value: Any = data[key]
+                    lifetime_value: Any = value
                     if isinstance(lifetime_value, dict):
                         lifetime_value = lifetime_value.get("value") or lifetime_value.get("percent")
                     if isinstance(lifetime_value, str):
@@ -135,7 +154,7 @@ class HelpersMixin:
                         self.upsert_state(device_id, sensor={"filter_life": lifetime_value})
 
                 case "airQuality":
-                    air_quality_value: Any = data[key]
+                    air_quality_value: Any = value
                     if isinstance(air_quality_value, dict):
                         air_quality_value = air_quality_value.get("value") or air_quality_value.get("level") or air_quality_value.get("name")
                     if isinstance(air_quality_value, str):
@@ -144,7 +163,7 @@ class HelpersMixin:
                         self.upsert_state(device_id, sensor={"air_quality": air_quality_value})
 
                 case "workMode":
-                    work_mode_data = data[key]
+                    work_mode_data = value
                     if not isinstance(work_mode_data, dict):
                         continue
                     internal = self.states.get(device_id, {}).get("internal", {})
@@ -197,7 +216,7 @@ class HelpersMixin:
                     internal = self.states.get(device_id, {}).get("internal", {})
                     manual_level_labels = internal.get("manual_level_labels", {})
                     gear_mode_labels = internal.get("gear_mode_labels", {})
-                    level_value = self._normalize_mode_numeric_value(data[key])
+                    level_value = self._normalize_mode_numeric_value(value)
                     if level_value is None:
                         continue
 
@@ -218,7 +237,6 @@ class HelpersMixin:
                     self.upsert_state(device_id, select={"work_mode": level_selection})
                 case key if key in {"lightScene", "diyScene", "snapshot"}:
                     internal = self.states.get(device_id, {}).get("internal", {})
-                    value = data[key]
                     api_scene_handled = False
 
                     # Handle API-fetched light scenes (stored in light_scene_values)
@@ -270,7 +288,6 @@ class HelpersMixin:
                     if dynamic_scene_selection:
                         self.upsert_state(device_id, select={component_key: dynamic_scene_selection})
                 case "segmentedBrightness":
-                    value = data[key]
                     if not isinstance(value, dict):
                         continue
                     segments = value.get("segment")
@@ -293,7 +310,6 @@ class HelpersMixin:
                         number={"segment_brightness": brightness_int},
                     )
                 case "segmentedColorRgb":
-                    value = data[key]
                     if not isinstance(value, dict):
                         continue
                     segments = value.get("segment")
@@ -315,7 +331,7 @@ class HelpersMixin:
                         number={"segment_rgb": rgb_int},
                     )
                 case "musicMode":
-                    music_data = data[key]
+                    music_data = value
                     if not isinstance(music_data, dict):
                         continue
                     component_music = component["cmps"]
@@ -328,11 +344,11 @@ class HelpersMixin:
                     number_updates: dict[str, int] = {}
                     switch_updates: dict[str, str] = {}
 
-                    options = music_state.get("options", {})
                     mode_value = music_data.get("musicMode")
                     music_mode_name: str | None = None
                     if isinstance(mode_value, int):
-                        music_mode_name = self.find_key_by_value(options, mode_value)
+                        music_mode_labels = self.states[device_id].get("internal", {}).get("music_mode_labels", {})
+                        music_mode_name = music_mode_labels.get(mode_value)
                     elif isinstance(mode_value, str):
                         music_mode_name = mode_value
                     if music_mode_name:
@@ -382,13 +398,14 @@ class HelpersMixin:
 
                     # Store the scene component for debugging/validation
                     internal_key = f"scene_{key}"  # "scene_id" or "scene_paramId"
-                    internal[internal_key] = data[key]
+                    internal[internal_key] = value
 
                     # Update internal state
                     self.upsert_state(device_id, internal=internal)
 
                     # Debug log to track scene state updates
-                    self.logger.debug(f"Device '{self.get_device_name(device_id)}' scene {key} => {data[key]}")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Device '{self.get_device_name(device_id)}' scene {key} => {value}")
 
                     # Validate scene ID matches the current scene (if set)
                     if key == "id":
@@ -408,18 +425,19 @@ class HelpersMixin:
                                 expected_id = expected_value
 
                             if expected_id is not None:
-                                if expected_id == data[key]:
-                                    self.logger.debug(
-                                        f"Scene ID {data[key]} confirms '{current_scene}' " f"scene is active on device '{self.get_device_name(device_id)}'"
-                                    )
+                                if expected_id == value:
+                                    if self.logger.isEnabledFor(logging.DEBUG):
+                                        self.logger.debug(
+                                            f"Scene ID {value} confirms '{current_scene}' " f"scene is active on device '{self.get_device_name(device_id)}'"
+                                        )
                                 else:
                                     self.logger.warning(
                                         f"Scene ID mismatch on device '{self.get_device_name(device_id)}': "
-                                        f"expected {expected_id} for '{current_scene}', got {data[key]}"
+                                        f"expected {expected_id} for '{current_scene}', got {value}"
                                     )
 
                 case _:
-                    self.logger.warning(f"Govee update for device '{self.get_device_name(device_id)}' ({device_id}), unhandled state {key} => {data[key]}")
+                    self.logger.warning(f"Govee update for device '{self.get_device_name(device_id)}' ({device_id}), unhandled state {key} => {value}")
 
     # convert MQTT attributes to Govee capabilities
     def build_govee_capabilities(self: Govee2Mqtt, device_id: str, attribute: str, payload: Any) -> dict[str, dict]:
@@ -482,19 +500,14 @@ class HelpersMixin:
                         "value": color,
                     }
 
-                case "gradient" | "nightlight" | "dreamview":
+                case key if key in LIGHT_MODE_TOGGLES:
                     state_on = str(value).lower() == "on"
                     switch[key] = "ON" if state_on else "OFF"
                     # if one mode turned ON the others must be OFF
-                    for other in {"gradient", "nightlight", "dreamview"} - {key}:
-                        switch[other] = "OFF"
-                    # Map keys to correct Govee capability instance names (camelCase)
-                    instance_map = {
-                        "gradient": "gradientToggle",
-                        "nightlight": "nightlightToggle",
-                        "dreamview": "dreamViewToggle",
-                    }
-                    instance_name = instance_map.get(key, f"{key}Toggle")
+                    for other in LIGHT_MODE_TOGGLES:
+                        if other != key:
+                            switch[other] = "OFF"
+                    instance_name = LIGHT_MODE_TOGGLES[key]
                     capabilities[instance_name] = {
                         "type": "devices.capabilities.toggle",
                         "instance": instance_name,
@@ -717,11 +730,9 @@ class HelpersMixin:
                 case _:
                     self.logger.warning(f"ignored unknown or invalid attribute: {key} => {value}")
 
-        # cannot send "turn" with either brightness or color
-        if "brightness" in capabilities and "turn" in capabilities:
-            del capabilities["turn"]
-        if "color" in capabilities and "turn" in capabilities:
-            del capabilities["turn"]
+        for winner, loser in CAPABILITY_SUBSUMES:
+            if winner in capabilities:
+                capabilities.pop(loser, None)
 
         if music_overrides:
             music_value = self._build_music_capability_value(device_id, music_overrides)
@@ -738,15 +749,15 @@ class HelpersMixin:
 
     def _get_device_lock(self: Govee2Mqtt, device_id: str) -> asyncio.Lock:
         """Get or create a per-device lock to serialize commands to the same device."""
-        if device_id not in self.command_locks:
-            self.command_locks[device_id] = asyncio.Lock()
-        return self.command_locks[device_id]
+        if (lock := self.command_locks.get(device_id)) is None:
+            lock = self.command_locks[device_id] = asyncio.Lock()
+        return lock
 
     def _get_pending_commands(self: Govee2Mqtt, device_id: str) -> dict[str, Any]:
         """Get or create a pending commands dict for a device."""
-        if device_id not in self._pending_commands:
-            self._pending_commands[device_id] = {}
-        return self._pending_commands[device_id]
+        if (pending := self._pending_commands.get(device_id)) is None:
+            pending = self._pending_commands[device_id] = {}
+        return pending
 
     def _normalize_color_key(self: Govee2Mqtt, key: str) -> str:
         """Normalize RGB color key aliases to 'rgb_color' for consistent conflict detection."""
@@ -887,6 +898,10 @@ class HelpersMixin:
 
     async def _send_single_command(self: Govee2Mqtt, device_id: str, attribute: str, command: Any) -> None:
         """Send a single (possibly batched) command to the Govee API."""
+        # someone is actively using this device, so drop it back to the normal refresh interval
+        self.device_idle_cycles.pop(device_id, None)
+        self.device_next_refresh.pop(device_id, None)
+
         # convert what we received in the command to Govee API capabilities
         capabilities = self.build_govee_capabilities(device_id, attribute, command)
         if not capabilities:
@@ -894,39 +909,49 @@ class HelpersMixin:
             return
 
         need_boost = False
-        for key in capabilities:
-            self.logger.debug(f"posting {key} to Govee API: " + ", ".join(f"{k}={v}" for k, v in capabilities[key].items()))
+        got_state = False
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        for key, capability in capabilities.items():
+            if debug_enabled:
+                self.logger.debug(f"posting {key} to Govee API: " + ", ".join(f"{k}={v}" for k, v in capability.items()))
             response = await self.post_command(
                 self.get_raw_id(device_id),
                 self.get_device_sku(device_id),
-                capabilities[key]["type"],
-                capabilities[key]["instance"],
-                capabilities[key]["value"],
+                capability["type"],
+                capability["instance"],
+                capability["value"],
             )
-            await self.publish_service_state()
 
             # no need to boost-refresh if we get the state back on the successful command response
             if len(response) > 0:
                 await self.build_device_states(device_id, response)
-                self.logger.debug(f"got response from Govee API: {response}")
-                await self.publish_device_state(device_id)
+                if debug_enabled:
+                    self.logger.debug(f"got response from Govee API: {response}")
+                got_state = True
 
-                # remove from boosted list (if there), since we got a change
-                if device_id in self.boosted:
-                    self.boosted.remove(device_id)
+                # remove from boosted set (if there), since we got a change
+                self.boosted.discard(device_id)
             else:
                 self.logger.debug(f"no details in response from Govee API: {response}")
                 need_boost = True
 
+        # publish the combined result of the whole batch once, not once per capability
+        await self.publish_service_state()
+        if got_state:
+            await self.publish_device_state(device_id)
+
         # if we send a command and did not get a state change back on the response
         # lets boost this device to refresh it soon, just in case
         if need_boost and device_id not in self.boosted:
-            self.boosted.append(device_id)
+            self.boosted.add(device_id)
+            self.boost_event.set()
 
     async def handle_service_command(self: Govee2Mqtt, handler: str, message: Any) -> None:
         match handler:
             case "refresh_interval":
                 self.device_interval = int(message)
+                self.device_idle_cycles.clear()
+                self.device_next_refresh.clear()
                 self.logger.info(f"refresh_interval updated to be {message}")
             case "rescan_interval":
                 self.device_list_interval = int(message)
@@ -939,19 +964,32 @@ class HelpersMixin:
                 return
         await self.publish_service_state()
 
-    async def rediscover_all(self: Govee2Mqtt) -> None:
-        await self.publish_service_state()
+    async def rediscover_all(self: Govee2Mqtt, device_discovery: bool = True) -> None:
+        # Home Assistant may have lost non-retained state, so republish everything
         await self.publish_service_discovery()
-        for device_id in self.devices:
-            await self.publish_device_state(device_id)
-            await self.publish_device_discovery(device_id)
+        # let the publish threads work through every device at once instead of one round-trip at a time
+        device_ids = list(self.devices)
+        if device_discovery:
+            await asyncio.gather(*(self.publish_device_discovery(device_id) for device_id in device_ids))
+        # discovery goes first so HA knows every entity before its state arrives; the cache is cleared
+        # after it so the states published below are what the next refresh dedupes against
+        self.published_states.clear()
+        await self.publish_service_state()
+        await asyncio.gather(*(self.publish_device_state(device_id) for device_id in device_ids))
 
     # Utility functions ---------------------------------------------------------------------------
 
     def _handle_signal(self: Govee2Mqtt, signum: int, frame: FrameType | None = None) -> None:
         sig_name = signal.Signals(signum).name
+        if not self.running:
+            # already shutting down (state saved, force-exit timer armed), don't do it all twice
+            self.logger.warning(f"{sig_name} received - already stopping")
+            return
         self.logger.warning(f"{sig_name} received - stopping service loop")
         self.running = False
+        # wake the boosted loop and anything waiting on discovery so they notice we are stopping
+        self.boost_event.set()
+        self.discovery_complete_event.set()
 
         # Try saving state before timer kicks in
         try:
@@ -1302,6 +1340,7 @@ class HelpersMixin:
               "host":         cast(str, mqtt.get("host"))            or os.getenv("MQTT_HOST", "localhost"),
               "port":     int(cast(str, mqtt.get("port")             or os.getenv("MQTT_PORT", 1883))),
               "qos":      int(cast(str, mqtt.get("qos")              or os.getenv("MQTT_QOS", 0))),
+              "state_qos": int(cast(str, mqtt.get("state_qos")       or os.getenv("MQTT_STATE_QOS", "0"))),
               "username":               mqtt.get("username")         or os.getenv("MQTT_USERNAME", ""),
               "password":               mqtt.get("password")         or os.getenv("MQTT_PASSWORD", ""),
               "tls_enabled":            mqtt.get("tls_enabled")      or (os.getenv("MQTT_TLS_ENABLED", "false").lower() == "true"),
@@ -1316,6 +1355,7 @@ class HelpersMixin:
         govee = {
             "api_key":                   govee.get("api_key") or os.getenv("GOVEE_API_KEY"),
             "device_interval":       int(cast(str, govee.get("device_interval") or os.getenv("GOVEE_DEVICE_INTERVAL", 30))),
+            "device_interval_max":   int(cast(str, govee.get("device_interval_max") or os.getenv("GOVEE_DEVICE_INTERVAL_MAX", "120"))),
             "device_boost_interval": int(cast(str, govee.get("device_boost_interval") or os.getenv("GOVEE_DEVICE_BOOST_INTERVAL", 5))),
             "device_list_interval":  int(cast(str, govee.get("device_list_interval") or os.getenv("GOVEE_LIST_INTERVAL", 3600))),
         }
@@ -1373,14 +1413,19 @@ class HelpersMixin:
             ["override"],
             ["override"],
         )
-        prev = self.devices.get(device_id, {})
+        # the merge happens in place, so compare what is coming in before it lands
+        changed = device_id not in self.devices
         for section, data in kwargs.items():
             self._assert_no_tuples(data, f"device[{device_id}].{section}")
+            if self.devices.get(device_id, {}).get(section) != data:
+                changed = True
             merged = MERGER.merge(self.devices.get(device_id, {}), {section: data})
             self._assert_no_tuples(merged, f"device[{device_id}].{section} (post-merge)")
             self.devices[device_id] = merged
-        new = self.devices.get(device_id, {})
-        return False if prev == new else True
+        if changed:
+            # the serialized discovery payload no longer matches the component
+            self.device_discovery_payloads.pop(device_id, None)
+        return changed
 
     def upsert_state(self: Govee2Mqtt, device_id: str, **kwargs: dict[str, Any] | str | int | bool | None) -> bool:
         MERGER = Merger(
@@ -5,13 +5,31 @@ from __future__ import annotations
 import asyncio
 import signal
 
+from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from govee2mqtt.interface import GoveeServiceProtocol as Govee2Mqtt
 
+# a loop only gives up (taking the service down for a restart) after this many failed cycles in a row
+MAX_CONSECUTIVE_LOOP_FAILURES = 5
+
 
 class LoopsMixin:
+    async def run_loop_step(self: Govee2Mqtt, name: str, step: Callable[[], Awaitable[None]]) -> None:
+        # one transient Govee or broker failure shouldn't end the loop, only one that keeps failing
+        try:
+            await step()
+        except Exception:
+            failures = self.loop_failures.get(name, 0) + 1
+            self.loop_failures[name] = failures
+            if failures >= MAX_CONSECUTIVE_LOOP_FAILURES:
+                self.logger.error(f"{name} failed {failures} times in a row, giving up")
+                raise
+            self.logger.exception(f"{name} failed, will retry next cycle ({failures}/{MAX_CONSECUTIVE_LOOP_FAILURES})")
+        else:
+            self.loop_failures.pop(name, None)
+
     async def device_list_loop(self: Govee2Mqtt) -> None:
         while self.running:
             try:
@@ -20,7 +38,7 @@ class LoopsMixin:
                 self.logger.debug("device_list_loop cancelled during sleep")
                 break
             if self.running:
-                await self.refresh_device_list()
+                await self.run_loop_step("device_list_loop", self.refresh_device_list)
 
     async def device_loop(self: Govee2Mqtt) -> None:
         while self.running:
@@ -30,17 +48,22 @@ class LoopsMixin:
                 self.logger.debug("device_loop cancelled during sleep")
                 break
             if self.running:
-                await self.refresh_all_devices()
+                await self.run_loop_step("device_loop", self.refresh_all_devices)
 
     async def device_boosted_loop(self: Govee2Mqtt) -> None:
         while self.running:
             try:
+                # stay idle until a command actually boosts a device
+                await self.boost_event.wait()
                 await asyncio.sleep(self.device_boost_interval)
             except asyncio.CancelledError:
                 self.logger.debug("device_boost_loop cancelled during sleep")
                 break
             if self.running:
-                await self.refresh_boosted_devices()
+                self.boost_event.clear()
+                await self.run_loop_step("device_boosted_loop", self.refresh_boosted_devices)
+                if self.boosted:
+                    self.boost_event.set()
 
     async def heartbeat(self: Govee2Mqtt) -> None:
         while self.running:
@@ -2,6 +2,7 @@
 # Copyright (c) 2025 Jeff Culverhouse
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Any
 
 from mqtt_helper import BaseMqttMixin, decode_mqtt_payload, parse_device_topic
@@ -32,7 +33,7 @@ class MqttMixin(BaseMqttMixin):
         if payload is None:
             return None
 
-        if components[0] == self.mqtt_config["discovery_prefix"]:
+        if components[0] == self.discovery_prefix:
             return await self.handle_homeassistant_message(payload)
 
         if components[0] == self.mqtt_helper.service_slug and components[1] == "service":
@@ -41,7 +42,9 @@ class MqttMixin(BaseMqttMixin):
         if components[0] == self.mqtt_helper.service_slug:
             return await self.handle_device_topic(components, payload)
 
-        self.logger.debug(f"did not process message on mqtt topic: {topic} with {payload}")
+        # runs on every stray message from the broker; don't format the payload just to drop it
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"did not process message on mqtt topic: {topic} with {payload}")
 
     async def handle_homeassistant_message(self: Govee2Mqtt, payload: str) -> None:
         if payload == "online":
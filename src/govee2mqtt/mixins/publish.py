@@ -4,18 +4,21 @@ from __future__ import annotations
 
 import asyncio
 from datetime import timezone
-import json
-from typing import TYPE_CHECKING
+import orjson
+from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from govee2mqtt.interface import GoveeServiceProtocol as Govee2Mqtt
 
+# marks a topic we have not published yet (None is a valid payload)
+_UNPUBLISHED = object()
+
 
 class PublishMixin:
 
     # Service -------------------------------------------------------------------------------------
 
-    async def publish_service_discovery(self: Govee2Mqtt) -> None:
+    def build_service_discovery_payload(self: Govee2Mqtt) -> bytes:
         device_id = "service"
 
         device = {
@@ -111,9 +114,20 @@ class PublishMixin:
             },
         }
 
-        topic = self.mqtt_helper.disc_t("device", device_id)
-        payload = {k: v for k, v in device.items() if k != "p"}
-        await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, json.dumps(payload), retain=True)
+        return orjson.dumps({k: v for k, v in device.items() if k != "p"})
+
+    async def publish_service_discovery(self: Govee2Mqtt) -> None:
+        device_id = "service"
+
+        # nothing in the service discovery changes after startup, so build and serialize it only once
+        payload = self.service_discovery_payload
+        if payload is None:
+            payload = self.build_service_discovery_payload()
+            # Base declares the attribute; keep its declared type so the mixin doesn't redefine it as plain bytes
+            self.service_discovery_payload = cast(bytes | None, payload)
+
+        topic = self.get_device_topic(device_id, "disc")
+        await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, payload, retain=True)
         self.upsert_state(device_id, internal={"discovered": True})
 
         self.logger.debug(f"discovery published for {self.service} ({self.mqtt_helper.service_slug})")
@@ -138,53 +152,125 @@ class PublishMixin:
             "boost_interval": self.device_boost_interval,
         }
 
+        # every service value is a scalar, so publish the ones that changed as-is in one trip to the publish thread
+        published = self.published_states.get("service", {})
+        messages = []
         for key, value in service.items():
-            await asyncio.to_thread(
-                self.mqtt_helper.safe_publish,
-                self.mqtt_helper.stat_t("service", "service", key),
-                json.dumps(value) if isinstance(value, dict) else value,
-            )
+            topic = self.get_device_topic("service", "stat", "service", key)
+            if published.get(topic, _UNPUBLISHED) != value:
+                messages.append((topic, value))
+        if messages:
+            await self.publish_state_messages({"service": messages})
 
     # Devices -------------------------------------------------------------------------------------
 
+    def get_device_topic(self: Govee2Mqtt, device_id: str, kind: str, *parts: str) -> str:
+        # topics never change for a device, so only build each one once
+        topics = self.device_topics.setdefault(device_id, {})
+        key = (kind, *parts)
+        topic = topics.get(key)
+        if topic is None:
+            match kind:
+                case "disc":
+                    topic = self.mqtt_helper.disc_t("device", device_id)
+                case "avty":
+                    topic = self.mqtt_helper.avty_t(device_id, *parts)
+                case "cmd":
+                    topic = self.mqtt_helper.cmd_t(device_id, *parts)
+                case "stat":
+                    topic = self.mqtt_helper.stat_t(device_id, *parts)
+                case _:
+                    raise ValueError(f"unknown topic kind {kind}")
+            topics[key] = topic
+        return topic
+
     async def publish_device_discovery(self: Govee2Mqtt, device_id: str) -> None:
-        topic = self.mqtt_helper.disc_t("device", device_id)
-        payload = json.dumps(self.devices[device_id]["component"])
+        topic = self.get_device_topic(device_id, "disc")
+        # every HA restart rediscovers every device, so only serialize a component again after it changes
+        payload = self.device_discovery_payloads.get(device_id)
+        if payload is None:
+            payload = orjson.dumps(self.devices[device_id]["component"])
+            self.device_discovery_payloads[device_id] = payload
 
         await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, payload, retain=True)
         self.upsert_state(device_id, internal={"discovered": True})
 
+        # make sure the next state publish goes out in full for the (re)discovered device
+        self.published_states.pop(device_id, None)
+
     async def publish_device_availability(self: Govee2Mqtt, device_id: str, online: bool = True) -> None:
-        topic = self.mqtt_helper.avty_t(device_id)
+        topic = self.get_device_topic(device_id, "avty")
         payload = "online" if online else "offline"
 
+        # every device-list rescan re-asserts availability; the retained message only needs to go out on a change
+        published = self.published_states.setdefault(device_id, {})
+        if published.get(topic) == payload:
+            return
+
         await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, payload, retain=True)
+        published[topic] = payload
+
+    def _publish_batch(self: Govee2Mqtt, messages: list[tuple[str, Any]]) -> None:
+        # runs in a worker thread: one hop per batch instead of one per topic
+        # every state topic is retained so HA picks up the last value when it (re)subscribes
+        for topic, payload in messages:
+            self.mqtt_helper.safe_publish(topic, payload, qos=self.state_qos, retain=True)
+
+    async def publish_state_messages(self: Govee2Mqtt, updates: dict[str, list[tuple[str, Any]]]) -> None:
+        # one trip to the publish thread for every device's changes, then remember what went out
+        await asyncio.to_thread(self._publish_batch, [message for messages in updates.values() for message in messages])
+
+        for device_id, messages in updates.items():
+            published = self.published_states.setdefault(device_id, {})
+            # nested dicts are merged in place by upsert_state, so only remember immutable payloads
+            for topic, payload in messages:
+                if isinstance(payload, (str, bytes, int, float, bool)) or payload is None:
+                    published[topic] = payload
+
+    def get_device_state_messages(self: Govee2Mqtt, device_id: str, subject: str = "", sub: str = "") -> list[tuple[str, Any]]:
+        published = self.published_states.get(device_id, {})
+        messages: list[tuple[str, Any]] = []
+
+        def queue_if_changed(topic: str, payload: Any) -> None:
+            # skip the broker round-trip when this exact payload already went out on this topic
+            if published.get(topic, _UNPUBLISHED) == payload:
+                return
+            messages.append((topic, payload))
 
-    async def publish_device_state(self: Govee2Mqtt, device_id: str, subject: str = "", sub: str = "") -> None:
         for state, value in self.states[device_id].items():
             if state == "internal" or (subject and state != subject):
                 continue
             # Attributes need to be published as a single JSON object to the attributes topic
             if state == "attributes" and isinstance(value, dict):
-                topic = self.mqtt_helper.stat_t(device_id, "attributes")
-                await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, json.dumps(value), retain=True)
+                topic = self.get_device_topic(device_id, "stat", "attributes")
+                queue_if_changed(topic, orjson.dumps(value))
             # otherwise, if it's a dict, publish each key/value pair separately
             elif isinstance(value, dict):
                 for k, v in value.items():
                     if sub and k != sub:
                         continue
-                    topic = self.mqtt_helper.stat_t(device_id, state, k)
-                    # if it's a list, convert to JSON
-                    if isinstance(v, list):
+                    topic = self.get_device_topic(device_id, "stat", state, k)
+                    # if it's a list or dict, convert to JSON; as bytes it can be remembered and skipped next time
+                    if isinstance(v, (list, dict)):
                         if state == "light" and k == "rgb_color" and v:
                             try:
                                 v = ",".join(str(int(channel)) for channel in v[:3])
                             except (TypeError, ValueError):
-                                v = json.dumps(v)
+                                v = orjson.dumps(v)
                         else:
-                            v = json.dumps(v)
-                    await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, v, retain=True)
+                            v = orjson.dumps(v)
+                    queue_if_changed(topic, v)
             # otherwise, publish the value as is
             else:
-                topic = self.mqtt_helper.stat_t(device_id, state)
-                await asyncio.to_thread(self.mqtt_helper.safe_publish, topic, value)
+                topic = self.get_device_topic(device_id, "stat", state)
+                queue_if_changed(topic, value)
+
+        return messages
+
+    async def publish_device_state(self: Govee2Mqtt, device_id: str, subject: str = "", sub: str = "") -> bool:
+        messages = self.get_device_state_messages(device_id, subject, sub)
+        if not messages:
+            return False
+
+        await self.publish_state_messages({device_id: messages})
+        return True
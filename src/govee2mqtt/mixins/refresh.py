@@ -3,37 +3,84 @@
 from __future__ import annotations
 
 import asyncio
+import time
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from govee2mqtt.interface import GoveeServiceProtocol as Govee2Mqtt
 
+# cap on simultaneous Govee API requests during a refresh, to stay friendly with their rate limits
+MAX_CONCURRENT_REFRESHES = 8
+
+# stop doubling a device's idle refresh interval after this many quiet cycles
+MAX_IDLE_BACKOFF = 6
+
 
 class RefreshMixin:
     async def refresh_all_devices(self: Govee2Mqtt) -> None:
         # don't let this kick off until we are done with our list
-        while not self.discovery_complete and self.running:
-            await asyncio.sleep(1)
+        await self.discovery_complete_event.wait()
+
+        # only poll the devices that are due, quiet ones back off on their own schedule
+        now = time.monotonic()
+        device_ids = [device_id for device_id in list(self.devices) if device_id not in self.boosted and self.device_next_refresh.get(device_id, 0) <= now]
+        if not device_ids:
+            return
+
+        self.logger.info(f"refreshing {len(device_ids)} of {len(self.devices)} devices from Govee")
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REFRESHES)
+
+        async def refresh(device_id: str) -> list[tuple[str, Any]]:
+            async with semaphore:
+                await self.build_device_states(device_id)
+            return self.get_device_state_messages(device_id)
+
+        results = await asyncio.gather(*(refresh(device_id) for device_id in device_ids), return_exceptions=True)
+
+        # send everything that changed this cycle as one publish batch, one bad device doesn't sink the rest
+        updates: dict[str, list[tuple[str, Any]]] = {}
+        for device_id, result in zip(device_ids, results):
+            # a cancelled refresh comes back as a BaseException, not an Exception
+            if isinstance(result, BaseException):
+                self.logger.error(f"error refreshing device '{self.get_device_name(device_id)}'", exc_info=result)
+            elif result:
+                updates[device_id] = result
+
+            # back off while a device isn't changing, snap back as soon as it does
+            if device_id in updates:
+                self.device_idle_cycles[device_id] = 0
+            else:
+                self.device_idle_cycles[device_id] = min(self.device_idle_cycles.get(device_id, 0) + 1, MAX_IDLE_BACKOFF)
+            self.device_next_refresh[device_id] = now + self.get_device_refresh_interval(device_id)
+
+        if updates:
+            await self.publish_state_messages(updates)
 
-        self.logger.info(f"refreshing all devices from Govee (every {self.device_interval} sec)")
+    def get_device_refresh_interval(self: Govee2Mqtt, device_id: str) -> int:
+        interval = self.device_interval << self.device_idle_cycles.get(device_id, 0)
+        return min(interval, max(self.device_interval, self.device_interval_max))
 
-        tasks = [self.build_device_states(device_id) for device_id in self.devices if device_id not in self.boosted]
-        await asyncio.gather(*tasks)
+    async def refresh_device(self: Govee2Mqtt, device_id: str) -> bool:
+        await self.build_device_states(device_id)
+        return await self.publish_device_state(device_id)
 
     # refresh boosted devices ---------------------------------------------------------------------
 
     async def refresh_boosted_devices(self: Govee2Mqtt) -> None:
         # don't let this kick off until we are done with our list
-        while not self.discovery_complete and self.running:
-            await asyncio.sleep(1)
+        await self.discovery_complete_event.wait()
 
-        if len(self.boosted) > 0:
-            self.logger.info(f"refreshing {len(self.boosted)} boosted devices from Govee")
+        if not self.boosted:
+            return
 
-            tasks = []
-            for device_id in self.boosted:
-                self.boosted.remove(device_id)
-                tasks.append(self.build_device_states(device_id))
+        # take the whole set in one go; commands may boost more devices while these refresh
+        boosted = list(self.boosted)
+        self.boosted.clear()
+        self.logger.info(f"refreshing {len(boosted)} boosted devices from Govee")
 
-            await asyncio.gather(*tasks)
+        results = await asyncio.gather(*(self.refresh_device(device_id) for device_id in boosted), return_exceptions=True)
+        for device_id, result in zip(boosted, results):
+            if isinstance(result, BaseException):
+                self.logger.error(f"error refreshing boosted device '{self.get_device_name(device_id)}'", exc_info=result)
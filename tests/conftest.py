@@ -13,6 +13,7 @@ def sample_govee_config() -> dict[str, Any]:
             "host": "localhost",
             "port": 1883,
             "qos": 0,
+            "state_qos": 0,
             "protocol_version": "5",
             "username": "testuser",
             "password": "testpass",
@@ -23,6 +24,7 @@ def sample_govee_config() -> dict[str, Any]:
         "govee": {
             "api_key": "test-api-key-12345",
             "device_interval": 30,
+            "device_interval_max": 120,
             "device_boost_interval": 5,
             "device_list_interval": 3600,
         },
@@ -70,6 +70,52 @@ class TestSaveState:
         with pytest.raises((PermissionError, FileNotFoundError)):
             Base.save_state(obj)
 
+    def test_replaces_file_without_leaving_temp(self, tmp_path):
+        state_file = tmp_path / "govee2mqtt.dat"
+        state_file.write_text("{}")
+
+        obj = MagicMock()
+        obj.config = {"config_path": str(tmp_path)}
+        obj.api_calls = 7
+        obj.last_call_date = datetime.now()
+        obj.logger = MagicMock()
+
+        Base.save_state(obj)
+
+        assert json.loads(state_file.read_text())["api_calls"] == 7
+        assert [p.name for p in tmp_path.iterdir()] == ["govee2mqtt.dat"]
+
+    def test_unchanged_state_not_rewritten(self, tmp_path):
+        state_file = tmp_path / "govee2mqtt.dat"
+
+        obj = MagicMock()
+        obj.config = {"config_path": str(tmp_path)}
+        obj.api_calls = 7
+        obj.last_call_date = datetime(2026, 1, 15, 10, 30, 0)
+        obj.logger = MagicMock()
+
+        Base.save_state(obj)
+        # a rewrite would replace this marker with the saved state again
+        state_file.write_text("marker")
+        Base.save_state(obj)
+
+        assert state_file.read_text() == "marker"
+
+    def test_missing_file_rewritten_even_if_unchanged(self, tmp_path):
+        state_file = tmp_path / "govee2mqtt.dat"
+
+        obj = MagicMock()
+        obj.config = {"config_path": str(tmp_path)}
+        obj.api_calls = 7
+        obj.last_call_date = datetime(2026, 1, 15, 10, 30, 0)
+        obj.logger = MagicMock()
+
+        Base.save_state(obj)
+        state_file.unlink()
+        Base.save_state(obj)
+
+        assert json.loads(state_file.read_text())["api_calls"] == 7
+
 
 class TestRestoreState:
     def test_restores_state_from_file(self, tmp_path):
@@ -157,7 +203,10 @@ class TestContextManager:
         obj.restore_state = MagicMock()
         obj.running = False
 
-        with patch("govee2mqtt.base.aiohttp.ClientSession") as mock_session_class:
+        with (
+            patch("govee2mqtt.base.aiohttp.ClientSession") as mock_session_class,
+            patch("govee2mqtt.base.aiohttp.TCPConnector") as mock_connector_class,
+        ):
             mock_session = MagicMock()
             mock_session_class.return_value = mock_session
 
@@ -167,6 +216,13 @@ class TestContextManager:
         obj.restore_state.assert_called_once()
         assert obj.running is True
 
+        # idle connections must outlive the default 30s refresh interval to be reused
+        assert mock_connector_class.call_args.kwargs["keepalive_timeout"] > 30
+        assert mock_session_class.call_args.kwargs["connector"] is mock_connector_class.return_value
+
+        serialize = mock_session_class.call_args.kwargs["json_serialize"]
+        assert json.loads(serialize({"capability": {"value": 1}})) == {"capability": {"value": 1}}
+
     @pytest.mark.asyncio
     async def test_aexit_closes_session_and_disconnects(self):
         obj = object.__new__(FakeBase)
@@ -182,15 +238,10 @@ class TestContextManager:
         obj.mqttc.loop_stop = MagicMock()
         obj.mqttc.disconnect = MagicMock()
 
-        with patch("govee2mqtt.base.asyncio.get_running_loop") as mock_loop:
-            loop = MagicMock()
-            loop.is_running.return_value = True
-            loop.create_task = MagicMock()
-            mock_loop.return_value = loop
-
-            await Base.__aexit__(obj, None, None, None)
+        await Base.__aexit__(obj, None, None, None)
 
         assert obj.running is False
+        obj.session.close.assert_awaited_once()
         obj.save_state.assert_called_once()
         obj.publish_service_availability.assert_called_once_with("offline")
         obj.mqttc.disconnect.assert_called_once()
@@ -1,9 +1,13 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Jeff Culverhouse
+import asyncio
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from govee2mqtt.mixins.govee import GoveeMixin
+import pytest
+
+from govee2mqtt.mixins.govee import GoveeMixin, _music_mode_labels
+from govee2mqtt.mixins.helpers import HelpersMixin
 
 
 # ---------------------------------------------------------------------------
@@ -13,7 +17,14 @@ class FakeGovee(GoveeMixin):
     def __init__(self) -> None:
         self.logger = MagicMock()
         self.devices: dict[str, Any] = {}
+        self.states: dict[str, Any] = {}
         self.discovery_complete = False
+        self.mqtt_helper = MagicMock()
+        self.mqtt_helper.dev_unique_id = MagicMock(side_effect=lambda d, e: f"govee2mqtt_{d}_{e}")
+        self.upsert_state = MagicMock()
+
+    def get_device_topic(self, device_id: str, kind: str, *parts: str) -> str:
+        return "/".join(["govee2mqtt", device_id, *parts] + (["set"] if kind == "cmd" else []))
 
 
 # ===========================================================================
@@ -94,3 +105,124 @@ class TestClassifyDevice:
         fake.discovery_complete = True
         fake.classify_device({"sku": "ZZZZ", "deviceName": "Mystery", "device": "00:00:00:00:00:00"})
         fake.logger.warning.assert_not_called()
+
+
+# ===========================================================================
+# TestMusicModeLabels
+# ===========================================================================
+class TestMusicModeLabels:
+    def test_maps_values_to_names(self) -> None:
+        assert _music_mode_labels({"Energic": 5, "Rhythm": 3}) == {5: "Energic", 3: "Rhythm"}
+
+    def test_first_name_wins_for_duplicate_value(self) -> None:
+        assert _music_mode_labels({"Energic": 5, "Dynamic": 5, "Rhythm": 3}) == {5: "Energic", 3: "Rhythm"}
+
+
+# ===========================================================================
+# TestBuildLightComponents
+# ===========================================================================
+class TestBuildLightComponents:
+    def _light(self, *instances: str) -> dict[str, Any]:
+        caps = [{"instance": i, "parameters": {"range": {"min": 2000, "max": 9000}}} for i in instances]
+        return {"device": "AA:BB:CC:DD:EE:FF", "sku": "H6008", "deviceName": "Desk", "capabilities": caps}
+
+    def test_brightness_only_light(self) -> None:
+        fake = FakeGovee()
+        light = fake.build_light_components("AABBCCDDEEFF", self._light("powerSwitch", "brightness"))["light"]
+
+        assert sorted(light["supported_color_modes"]) == ["brightness", "onoff"]
+        assert light["brightness_state_topic"] == "govee2mqtt/AABBCCDDEEFF/light/brightness"
+        assert light["brightness_command_topic"] == "govee2mqtt/AABBCCDDEEFF/light/brightness/set"
+        assert "rgb_state_topic" not in light
+
+    def test_color_light_drops_simple_modes(self) -> None:
+        fake = FakeGovee()
+        light = fake.build_light_components("AABBCCDDEEFF", self._light("powerSwitch", "brightness", "colorRgb", "colorTemperatureK"))["light"]
+
+        assert sorted(light["supported_color_modes"]) == ["color_temp", "rgb"]
+        assert light["rgb_state_topic"] == "govee2mqtt/AABBCCDDEEFF/light/rgb_color"
+        assert light["color_temp_command_topic"] == "govee2mqtt/AABBCCDDEEFF/light/color_temp/set"
+        assert light["min_kelvin"] == 2000
+        assert light["max_kelvin"] == 9000
+
+
+# ===========================================================================
+# TestBuildSensor
+# ===========================================================================
+class TestBuildSensor:
+    @pytest.mark.asyncio
+    async def test_humidity_sensor_uses_template(self) -> None:
+        fake = FakeGovee()
+        fake.service = "govee2mqtt"
+        fake.device_origin = {"name": "govee2mqtt service", "sw": "v0.1.0-test"}
+        fake.qos = 0
+        fake.prepare_device = AsyncMock()
+        sensor = {"device": "AA:BB:CC:DD:EE:FF", "sku": "H5075", "deviceName": "Hygrometer", "capabilities": [{"instance": "sensorHumidity"}]}
+
+        device_id = await fake.build_sensor(sensor)
+
+        assert device_id == "AABBCCDDEEFF_hmdy"
+        device = fake.prepare_device.call_args.args[0]
+        humidity = device["cmps"]["humidity"]
+        assert humidity["unit_of_measurement"] == "%"
+        assert humidity["uniq_id"] == "govee2mqtt_AABBCCDDEEFF_hmdy_humidity"
+        assert humidity["stat_t"] == "govee2mqtt/AABBCCDDEEFF/sensor"
+        assert device["origin"] == fake.device_origin
+        # each payload gets its own copy, deepmerge merges in place
+        assert device["origin"] is not fake.device_origin
+
+    @pytest.mark.asyncio
+    async def test_unsupported_sensor_capability_is_skipped(self) -> None:
+        fake = FakeGovee()
+        fake.prepare_device = AsyncMock()
+        sensor = {"device": "AA:BB:CC:DD:EE:FF", "sku": "H5075", "deviceName": "Hygrometer", "capabilities": [{"instance": "online"}]}
+
+        assert await fake.build_sensor(sensor) == ""
+        fake.prepare_device.assert_not_awaited()
+
+
+# ===========================================================================
+# TestFirstDeviceListPass
+# ===========================================================================
+class FakeGoveeHelpers(FakeGovee, HelpersMixin):
+    """FakeGovee with the real rediscover_all, to drive the first device-list pass end to end."""
+
+
+class TestFirstDeviceListPass:
+    def _fake(self) -> FakeGoveeHelpers:
+        fake = FakeGoveeHelpers()
+        fake.device_list_interval = 3600
+        fake.devices = {"LIGHT001": {}, "LIGHT002": {}}
+        fake.published_states = {}
+        fake.discovery_complete_event = asyncio.Event()
+        fake.get_device_list = AsyncMock(return_value=[{"device": "LIGHT001"}, {"device": "LIGHT002"}])
+        fake.build_component = AsyncMock(side_effect=lambda device: device["device"])
+        fake.publish_device_availability = AsyncMock()
+        fake.publish_service_discovery = AsyncMock()
+        fake.publish_service_state = AsyncMock()
+
+        async def publish_device_discovery(device_id: str) -> None:
+            fake.published_states.pop(device_id, None)
+
+        async def publish_device_state(device_id: str) -> None:
+            fake.published_states.setdefault(device_id, {})[f"govee2mqtt/{device_id}/light/state"] = "ON"
+
+        fake.publish_device_discovery = AsyncMock(side_effect=publish_device_discovery)
+        fake.publish_device_state = AsyncMock(side_effect=publish_device_state)
+        return fake
+
+    @pytest.mark.asyncio
+    async def test_skips_device_discovery_and_keeps_published_states(self) -> None:
+        fake = self._fake()
+
+        with patch("govee2mqtt.mixins.govee.asyncio.sleep", new=AsyncMock()):
+            await fake.refresh_device_list()
+
+        fake.publish_device_discovery.assert_not_awaited()
+        fake.publish_service_discovery.assert_awaited_once()
+        assert fake.published_states == {
+            "LIGHT001": {"govee2mqtt/LIGHT001/light/state": "ON"},
+            "LIGHT002": {"govee2mqtt/LIGHT002/light/state": "ON"},
+        }
+        assert fake.discovery_complete is True
+        assert fake.discovery_complete_event.is_set()
@@ -1,8 +1,9 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Jeff Culverhouse
+import asyncio
 import signal
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import yaml
@@ -20,6 +21,9 @@ class FakeHelpers(HelpersMixin):
         self.running = True
         self.devices: dict[str, Any] = {}
         self.states: dict[str, Any] = {}
+        self.boost_event = asyncio.Event()
+        self.discovery_complete_event = asyncio.Event()
+        self.device_discovery_payloads: dict[str, bytes] = {}
 
     # save_state is called by _handle_signal; stub it out
     def save_state(self) -> None:
@@ -183,6 +187,14 @@ class TestUpsertDevice:
         result = fake.upsert_device("DEV001", component={"name": "Test Light"})
         assert result is False
 
+    def test_changed_data_returns_true(self) -> None:
+        fake = FakeHelpers()
+        fake.upsert_device("DEV001", component={"name": "Test Light"})
+        fake.device_discovery_payloads["DEV001"] = b"{}"
+        result = fake.upsert_device("DEV001", component={"name": "Desk Light"})
+        assert result is True
+        assert "DEV001" not in fake.device_discovery_payloads
+
     def test_upsert_state_merges_nested(self) -> None:
         fake = FakeHelpers()
         fake.upsert_state("DEV001", light={"state": "ON"})
@@ -191,6 +203,59 @@ class TestUpsertDevice:
         assert fake.states["DEV001"]["light"]["brightness"] == 100
 
 
+# ===========================================================================
+# TestBuildDeviceStates
+# ===========================================================================
+class TestBuildDeviceStates:
+    @pytest.mark.asyncio
+    async def test_direct_keys_stored_as_is(self) -> None:
+        fake = FakeHelpers()
+        fake.devices["DEV001"] = {"component": {"cmps": {}}}
+        await fake.build_device_states("DEV001", {"brightness": 42, "sensorTemperature": 21.5, "sensorHumidity": 40})
+        assert fake.states["DEV001"]["light"] == {"brightness": 42}
+        assert fake.states["DEV001"]["sensor"] == {"temperature": 21.5, "humidity": 40}
+
+    @pytest.mark.asyncio
+    async def test_music_mode_resolved_from_labels(self) -> None:
+        fake = FakeHelpers()
+        fake.devices["DEV001"] = {"component": {"cmps": {"music_mode": {}}}}
+        fake.upsert_state(
+            "DEV001",
+            music={"options": {"Energic": 5, "Rhythm": 3}, "mode": "Energic"},
+            internal={"music_mode_labels": {5: "Energic", 3: "Rhythm"}},
+        )
+        await fake.build_device_states("DEV001", {"musicMode": {"musicMode": 3}})
+        assert fake.states["DEV001"]["music"]["mode"] == "Rhythm"
+        assert fake.states["DEV001"]["select"]["music_mode"] == "Rhythm"
+
+
+# ===========================================================================
+# TestBuildGoveeCapabilities
+# ===========================================================================
+class TestBuildGoveeCapabilities:
+    def _fake(self) -> FakeHelpers:
+        fake = FakeHelpers()
+        fake.devices["LIGHT001"] = {"component": {"cmps": {}}}
+        fake.states["LIGHT001"] = {"light": {}, "switch": {"gradient": "OFF", "nightlight": "OFF"}}
+        return fake
+
+    def test_light_mode_turns_others_off(self) -> None:
+        fake = self._fake()
+
+        capabilities = fake.build_govee_capabilities("LIGHT001", "nightlight", "ON")
+
+        assert capabilities == {"nightlightToggle": {"type": "devices.capabilities.toggle", "instance": "nightlightToggle", "value": 1}}
+        assert fake.states["LIGHT001"]["switch"] == {"gradient": "OFF", "nightlight": "ON", "dreamview": "OFF"}
+
+    def test_unknown_mode_key_is_ignored(self) -> None:
+        fake = self._fake()
+
+        capabilities = fake.build_govee_capabilities("LIGHT001", "sunrise", "ON")
+
+        assert capabilities == {}
+        assert fake.states["LIGHT001"]["switch"] == {"gradient": "OFF", "nightlight": "OFF"}
+
+
 # ===========================================================================
 # TestHandleSignal
 # ===========================================================================
@@ -207,3 +272,118 @@ class TestHandleSignal:
         fake.logger.warning.assert_called()
         call_args = fake.logger.warning.call_args[0][0]
         assert "SIGINT" in call_args
+
+    def test_second_signal_does_not_rearm_exit(self) -> None:
+        fake = FakeHelpers()
+        fake.save_state = MagicMock()
+        with patch("govee2mqtt.mixins.helpers.threading.Timer") as mock_timer:
+            fake._handle_signal(signal.SIGTERM)
+            fake._handle_signal(signal.SIGINT)
+        mock_timer.assert_called_once()
+        fake.save_state.assert_called_once()
+
+    def test_signal_releases_discovery_waiters(self) -> None:
+        fake = FakeHelpers()
+        with patch("govee2mqtt.mixins.helpers.threading.Timer"):
+            fake._handle_signal(signal.SIGTERM)
+        assert fake.discovery_complete_event.is_set()
+
+
+# ===========================================================================
+# TestSendSingleCommand
+# ===========================================================================
+class TestSendSingleCommand:
+    @pytest.mark.asyncio
+    async def test_batch_publishes_once(self) -> None:
+        fake = FakeHelpers()
+        fake.boosted = {"LIGHT001"}
+        fake.device_idle_cycles = {"LIGHT001": 3}
+        fake.device_next_refresh = {"LIGHT001": 1000.0}
+        fake.build_govee_capabilities = MagicMock(
+            return_value={
+                "powerSwitch": {"type": "devices.capabilities.on_off", "instance": "powerSwitch", "value": 1},
+                "brightness": {"type": "devices.capabilities.range", "instance": "brightness", "value": 50},
+            }
+        )
+        fake.get_raw_id = MagicMock(return_value="AA:BB")
+        fake.get_device_sku = MagicMock(return_value="H6008")
+        fake.post_command = AsyncMock(return_value={"powerSwitch": 1})
+        fake.build_device_states = AsyncMock()
+        fake.publish_service_state = AsyncMock()
+        fake.publish_device_state = AsyncMock()
+
+        await fake._send_single_command("LIGHT001", "light", {"state": "ON", "brightness": 50})
+
+        assert fake.post_command.await_count == 2
+        assert fake.build_device_states.await_count == 2
+        fake.publish_service_state.assert_awaited_once()
+        fake.publish_device_state.assert_awaited_once_with("LIGHT001")
+        assert fake.boosted == set()
+        assert "LIGHT001" not in fake.device_idle_cycles
+        assert "LIGHT001" not in fake.device_next_refresh
+
+
+# ===========================================================================
+# TestRediscoverAll
+# ===========================================================================
+class TestRediscoverAll:
+    def _fake(self) -> tuple[FakeHelpers, list[tuple[str, str]]]:
+        fake = FakeHelpers()
+        fake.devices = {"LIGHT001": {}, "LIGHT002": {}}
+        fake.published_states = {"LIGHT001": {"govee2mqtt/LIGHT001/old/state": "OFF"}}
+        fake.publish_service_discovery = AsyncMock()
+        fake.publish_service_state = AsyncMock()
+        calls: list[tuple[str, str]] = []
+
+        # mirror the real cache handling: discovery drops a device's cache, a state publish refills it
+        async def publish_device_discovery(device_id: str) -> None:
+            calls.append(("discovery", device_id))
+            fake.published_states.pop(device_id, None)
+
+        async def publish_device_state(device_id: str) -> None:
+            calls.append(("state", device_id))
+            fake.published_states.setdefault(device_id, {})[f"govee2mqtt/{device_id}/light/state"] = "ON"
+
+        fake.publish_device_discovery = AsyncMock(side_effect=publish_device_discovery)
+        fake.publish_device_state = AsyncMock(side_effect=publish_device_state)
+        return fake, calls
+
+    @pytest.mark.asyncio
+    async def test_republishes_everything(self) -> None:
+        fake, _ = self._fake()
+
+        await fake.rediscover_all()
+
+        fake.publish_service_discovery.assert_awaited_once()
+        fake.publish_service_state.assert_awaited_once()
+        assert fake.publish_device_state.await_count == 2
+        assert fake.publish_device_discovery.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_publishes_discovery_before_state(self) -> None:
+        fake, calls = self._fake()
+
+        await fake.rediscover_all()
+
+        assert [kind for kind, _ in calls] == ["discovery", "discovery", "state", "state"]
+
+    @pytest.mark.asyncio
+    async def test_leaves_published_states_filled(self) -> None:
+        fake, _ = self._fake()
+
+        await fake.rediscover_all()
+
+        assert fake.published_states == {
+            "LIGHT001": {"govee2mqtt/LIGHT001/light/state": "ON"},
+            "LIGHT002": {"govee2mqtt/LIGHT002/light/state": "ON"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_can_skip_device_discovery(self) -> None:
+        fake, _ = self._fake()
+
+        await fake.rediscover_all(device_discovery=False)
+
+        fake.publish_service_discovery.assert_awaited_once()
+        assert fake.publish_device_state.await_count == 2
+        fake.publish_device_discovery.assert_not_awaited()
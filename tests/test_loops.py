@@ -4,7 +4,7 @@ import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from govee2mqtt.mixins.loops import LoopsMixin
+from govee2mqtt.mixins.loops import MAX_CONSECUTIVE_LOOP_FAILURES, LoopsMixin
 from govee2mqtt.mixins.helpers import HelpersMixin
 
 
@@ -15,6 +15,9 @@ class FakeLooper(HelpersMixin, LoopsMixin):
         self.device_interval = 1
         self.device_list_interval = 1
         self.device_boost_interval = 1
+        self.boost_event = asyncio.Event()
+        self.boosted = set()
+        self.loop_failures = {}
 
     async def refresh_all_devices(self):
         pass
@@ -63,10 +66,48 @@ class TestDeviceLoop:
         looper.logger.debug.assert_called()
 
 
+class TestRunLoopStep:
+    @pytest.mark.asyncio
+    async def test_failure_is_logged_and_loop_continues(self):
+        looper = FakeLooper()
+
+        await looper.run_loop_step("device_loop", AsyncMock(side_effect=RuntimeError("broker down")))
+
+        looper.logger.exception.assert_called_once()
+        assert looper.loop_failures == {"device_loop": 1}
+
+    @pytest.mark.asyncio
+    async def test_success_resets_failures(self):
+        looper = FakeLooper()
+        looper.loop_failures = {"device_loop": 3}
+
+        await looper.run_loop_step("device_loop", AsyncMock())
+
+        assert looper.loop_failures == {}
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_consecutive_failures(self):
+        looper = FakeLooper()
+        looper.loop_failures = {"device_loop": MAX_CONSECUTIVE_LOOP_FAILURES - 1}
+
+        with pytest.raises(RuntimeError):
+            await looper.run_loop_step("device_loop", AsyncMock(side_effect=RuntimeError("broker down")))
+
+    @pytest.mark.asyncio
+    async def test_cancellation_is_not_swallowed(self):
+        looper = FakeLooper()
+
+        with pytest.raises(asyncio.CancelledError):
+            await looper.run_loop_step("device_loop", AsyncMock(side_effect=asyncio.CancelledError))
+
+        assert looper.loop_failures == {}
+
+
 class TestDeviceBoostedLoop:
     @pytest.mark.asyncio
     async def test_sleep_first_pattern(self):
         looper = FakeLooper()
+        looper.boost_event.set()
 
         async def mock_sleep(seconds):
             looper.running = False
@@ -82,12 +123,35 @@ class TestDeviceBoostedLoop:
     @pytest.mark.asyncio
     async def test_handles_cancelled_error(self):
         looper = FakeLooper()
+        looper.boost_event.set()
 
         with patch("govee2mqtt.mixins.loops.asyncio.sleep", side_effect=asyncio.CancelledError):
             await looper.device_boosted_loop()
 
         looper.logger.debug.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_idle_until_boost_event(self):
+        looper = FakeLooper()
+        looper.device_boost_interval = 0
+        refreshed = asyncio.Event()
+
+        async def mock_refresh():
+            looper.running = False
+            refreshed.set()
+
+        looper.refresh_boosted_devices = mock_refresh
+
+        task = asyncio.create_task(looper.device_boosted_loop())
+        await asyncio.sleep(0.01)
+        assert not refreshed.is_set()
+
+        looper.boost_event.set()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert refreshed.is_set()
+        assert not looper.boost_event.is_set()
+
 
 class TestHeartbeat:
     @pytest.mark.asyncio
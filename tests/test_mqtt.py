@@ -45,6 +45,7 @@ class FakeMqtt(MqttMixin):
             "password": "test",
             "tls_enabled": False,
         }
+        self.discovery_prefix = "homeassistant"
         self.mqtt_helper = MagicMock()
         self.mqtt_helper.service_slug = "govee2mqtt"
         self.mqtt_connect_time = None
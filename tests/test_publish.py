@@ -13,6 +13,7 @@ class FakePublisher(HelpersMixin, PublishMixin):
         self.service = "govee2mqtt"
         self.service_name = "govee2mqtt service"
         self.qos = 0
+        self.state_qos = 0
         self.config = {"version": "v0.1.0-test"}
         self.logger = MagicMock()
         self.mqtt_helper = MagicMock()
@@ -27,6 +28,10 @@ class FakePublisher(HelpersMixin, PublishMixin):
         self.mqtt_helper.disc_t = MagicMock(side_effect=lambda kind, did: f"homeassistant/{kind}/govee2mqtt_{did}/config")
         self.devices = {}
         self.states = {}
+        self.published_states = {}
+        self.device_topics = {}
+        self.service_discovery_payload = None
+        self.device_discovery_payloads = {}
 
 
 async def _fake_to_thread(fn, *args, **kwargs):
@@ -51,6 +56,20 @@ class TestServiceDiscovery:
         assert "cmps" in payload
         assert len(payload["cmps"]) == 6
 
+    @pytest.mark.asyncio
+    async def test_payload_built_once(self):
+        pub = FakePublisher()
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_service_discovery()
+            pub.mqtt_helper.svc_unique_id.reset_mock()
+            await pub.publish_service_discovery()
+
+        pub.mqtt_helper.svc_unique_id.assert_not_called()
+        first, second = pub.mqtt_helper.safe_publish.call_args_list
+        assert first.args[1] is second.args[1]
+
     @pytest.mark.asyncio
     async def test_retain_true_on_publish(self):
         pub = FakePublisher()
@@ -130,6 +149,54 @@ class TestServiceState:
         assert any("boost_interval" in t for t in topics)
         assert any("rate_limited" in t for t in topics)
 
+    @pytest.mark.asyncio
+    async def test_metrics_published_in_one_hop(self):
+        from datetime import datetime
+
+        pub = FakePublisher()
+        pub.api_calls = 42
+        pub.last_call_date = datetime(2026, 1, 15, 10, 30, 0)
+        pub.rate_limited = False
+        pub.device_interval = 30
+        pub.device_list_interval = 3600
+        pub.device_boost_interval = 5
+        hops = []
+
+        async def counting_to_thread(fn, *args, **kwargs):
+            hops.append(fn)
+            return fn(*args, **kwargs)
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = counting_to_thread
+            await pub.publish_service_state()
+
+        assert len(hops) == 1
+        assert pub.mqtt_helper.safe_publish.call_count == 7
+        assert all(c.kwargs["qos"] == pub.state_qos for c in pub.mqtt_helper.safe_publish.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_metrics_not_republished(self):
+        from datetime import datetime
+
+        pub = FakePublisher()
+        pub.api_calls = 42
+        pub.last_call_date = datetime(2026, 1, 15, 10, 30, 0)
+        pub.rate_limited = False
+        pub.device_interval = 30
+        pub.device_list_interval = 3600
+        pub.device_boost_interval = 5
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_service_state()
+            pub.mqtt_helper.safe_publish.reset_mock()
+            await pub.publish_service_state()
+            pub.api_calls = 43
+            await pub.publish_service_state()
+
+        topics = [c.args[0] for c in pub.mqtt_helper.safe_publish.call_args_list]
+        assert topics == ["govee2mqtt/service/service/api_calls"]
+
 
 class TestDeviceDiscovery:
     @pytest.mark.asyncio
@@ -175,6 +242,24 @@ class TestDeviceDiscovery:
 
         assert pub.states["LIGHT001"]["internal"]["discovered"] is True
 
+    @pytest.mark.asyncio
+    async def test_payload_serialized_until_component_changes(self):
+        pub = FakePublisher()
+        pub.upsert_device("LIGHT001", component={"device": {"name": "Bedroom Light"}})
+        pub.states["LIGHT001"] = {}
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_discovery("LIGHT001")
+            pub.device_discovery_payloads["LIGHT001"] = b"cached"
+            await pub.publish_device_discovery("LIGHT001")
+            assert pub.mqtt_helper.safe_publish.call_args.args[1] == b"cached"
+
+            pub.upsert_device("LIGHT001", component={"device": {"name": "Bedroom Lamp"}})
+            await pub.publish_device_discovery("LIGHT001")
+
+        assert json.loads(pub.mqtt_helper.safe_publish.call_args.args[1])["device"]["name"] == "Bedroom Lamp"
+
 
 class TestDeviceAvailability:
     @pytest.mark.asyncio
@@ -188,6 +273,19 @@ class TestDeviceAvailability:
         call_args = pub.mqtt_helper.safe_publish.call_args
         assert call_args.kwargs.get("retain") is True or (len(call_args.args) > 2 and call_args.args[2] is True)
 
+    @pytest.mark.asyncio
+    async def test_unchanged_availability_not_republished(self):
+        pub = FakePublisher()
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_availability("LIGHT001", online=True)
+            await pub.publish_device_availability("LIGHT001", online=True)
+            await pub.publish_device_availability("LIGHT001", online=False)
+
+        payloads = [c.args[1] for c in pub.mqtt_helper.safe_publish.call_args_list]
+        assert payloads == ["online", "offline"]
+
 
 class TestDeviceState:
     @pytest.mark.asyncio
@@ -240,6 +338,25 @@ class TestDeviceState:
                 assert c.kwargs.get("retain") is True or (len(c.args) > 2 and c.args[2] is True)
                 break
 
+    @pytest.mark.asyncio
+    async def test_every_state_topic_passes_retain_explicitly(self):
+        pub = FakePublisher()
+        pub.state_qos = 1
+        pub.states["LIGHT001"] = {
+            "light": {"state": "ON"},
+            "attributes": {"sku": "H6008"},
+            "online": "yes",
+        }
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_state("LIGHT001")
+
+        calls = pub.mqtt_helper.safe_publish.call_args_list
+        assert len(calls) == 3
+        for c in calls:
+            assert c.kwargs == {"qos": 1, "retain": True}
+
     @pytest.mark.asyncio
     async def test_list_values_encoded_as_json(self):
         pub = FakePublisher()
@@ -253,7 +370,7 @@ class TestDeviceState:
 
         for c in pub.mqtt_helper.safe_publish.call_args_list:
             if "items" in c.args[0]:
-                assert c.args[1] == json.dumps([1, 2, 3])
+                assert json.loads(c.args[1]) == [1, 2, 3]
                 break
 
     @pytest.mark.asyncio
@@ -274,3 +391,125 @@ class TestDeviceState:
                 break
         else:
             pytest.fail("attributes not published")
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_not_republished(self):
+        pub = FakePublisher()
+        pub.states["LIGHT001"] = {
+            "light": {"state": "ON", "brightness": 50},
+        }
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_state("LIGHT001")
+            first_count = pub.mqtt_helper.safe_publish.call_count
+            pub.states["LIGHT001"]["light"]["brightness"] = 75
+            await pub.publish_device_state("LIGHT001")
+
+        assert first_count == 2
+        assert pub.mqtt_helper.safe_publish.call_count == 3
+        assert pub.mqtt_helper.safe_publish.call_args.args[0] == "govee2mqtt/LIGHT001/light/brightness"
+
+    @pytest.mark.asyncio
+    async def test_unchanged_nested_dict_not_republished(self):
+        pub = FakePublisher()
+        pub.states["LIGHT001"] = {
+            "music": {"options": {"Energic": 5, "Rhythm": 3}},
+        }
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_state("LIGHT001")
+            assert await pub.publish_device_state("LIGHT001") is False
+            pub.states["LIGHT001"]["music"]["options"]["Spectrum"] = 4
+            assert await pub.publish_device_state("LIGHT001") is True
+
+        assert pub.mqtt_helper.safe_publish.call_count == 2
+        assert json.loads(pub.mqtt_helper.safe_publish.call_args.args[1]) == {"Energic": 5, "Rhythm": 3, "Spectrum": 4}
+
+    @pytest.mark.asyncio
+    async def test_state_batch_uses_one_thread_hop(self):
+        pub = FakePublisher()
+        pub.states["LIGHT001"] = {
+            "light": {"state": "ON", "brightness": 50},
+            "attributes": {"sku": "H6008"},
+        }
+        hops = []
+
+        async def counting_to_thread(fn, *args, **kwargs):
+            hops.append(fn)
+            return fn(*args, **kwargs)
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = counting_to_thread
+            await pub.publish_device_state("LIGHT001")
+
+        assert len(hops) == 1
+        assert pub.mqtt_helper.safe_publish.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_discovery_forces_full_republish(self):
+        pub = FakePublisher()
+        pub.devices["LIGHT001"] = {"component": {"device": {"name": "Bedroom Light"}}}
+        pub.states["LIGHT001"] = {
+            "light": {"state": "ON"},
+        }
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_state("LIGHT001")
+            await pub.publish_device_discovery("LIGHT001")
+            pub.mqtt_helper.safe_publish.reset_mock()
+            await pub.publish_device_state("LIGHT001")
+
+        topics = [c.args[0] for c in pub.mqtt_helper.safe_publish.call_args_list]
+        assert "govee2mqtt/LIGHT001/light/state" in topics
+
+    @pytest.mark.asyncio
+    async def test_state_topics_built_once_per_device(self):
+        pub = FakePublisher()
+        pub.states["LIGHT001"] = {
+            "light": {"state": "ON"},
+        }
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_state("LIGHT001")
+            pub.states["LIGHT001"]["light"]["state"] = "OFF"
+            await pub.publish_device_state("LIGHT001")
+
+        assert pub.mqtt_helper.safe_publish.call_count == 2
+        pub.mqtt_helper.stat_t.assert_called_once_with("LIGHT001", "light", "state")
+
+    def test_command_topics_cached_per_device(self):
+        pub = FakePublisher()
+
+        first = pub.get_device_topic("LIGHT001", "cmd", "light", "brightness")
+        second = pub.get_device_topic("LIGHT001", "cmd", "light", "brightness")
+
+        assert first == second == "govee2mqtt/LIGHT001/light/brightness/set"
+        pub.mqtt_helper.cmd_t.assert_called_once_with("LIGHT001", "light", "brightness")
+
+    def test_unknown_topic_kind_raises(self):
+        pub = FakePublisher()
+
+        with pytest.raises(ValueError, match="unknown topic kind state"):
+            pub.get_device_topic("LIGHT001", "state", "light", "state")
+
+        pub.mqtt_helper.stat_t.assert_not_called()
+        assert pub.device_topics["LIGHT001"] == {}
+
+    @pytest.mark.asyncio
+    async def test_state_published_with_state_qos(self):
+        pub = FakePublisher()
+        pub.state_qos = 0
+        pub.qos = 1
+        pub.states["LIGHT001"] = {
+            "light": {"state": "ON"},
+        }
+
+        with patch("govee2mqtt.mixins.publish.asyncio") as mock_asyncio:
+            mock_asyncio.to_thread = _fake_to_thread
+            await pub.publish_device_state("LIGHT001")
+
+        assert pub.mqtt_helper.safe_publish.call_args.kwargs["qos"] == 0
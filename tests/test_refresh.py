@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: MIT
 # Copyright (c) 2025 Jeff Culverhouse
+import asyncio
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+import time
+from unittest.mock import AsyncMock, MagicMock
 
-from govee2mqtt.mixins.refresh import RefreshMixin
+from govee2mqtt.mixins.refresh import MAX_CONCURRENT_REFRESHES, RefreshMixin
 from govee2mqtt.mixins.helpers import HelpersMixin
 
 
@@ -12,11 +14,16 @@ class FakeRefresher(HelpersMixin, RefreshMixin):
         self.logger = MagicMock()
         self.running = True
         self.device_interval = 30
+        self.device_interval_max = 120
+        self.device_idle_cycles = {}
+        self.device_next_refresh = {}
         self.device_boost_interval = 5
         self.discovery_complete = True
+        self.discovery_complete_event = asyncio.Event()
+        self.discovery_complete_event.set()
         self.devices = {}
         self.states = {}
-        self.boosted = []
+        self.boosted = set()
 
     async def build_device_states(self, device_id, data=None):
         pass
@@ -24,33 +31,37 @@ class FakeRefresher(HelpersMixin, RefreshMixin):
     async def get_device(self, device_id):
         return {}
 
+    async def publish_device_state(self, device_id, subject="", sub=""):
+        return False
+
+    def get_device_state_messages(self, device_id, subject="", sub=""):
+        return []
+
+    async def publish_state_messages(self, updates):
+        pass
+
 
 class TestRefreshAllDevices:
     @pytest.mark.asyncio
     async def test_waits_for_discovery_gate(self):
         r = FakeRefresher()
-        r.discovery_complete = False
+        r.discovery_complete_event.clear()
         r.devices = {"LIGHT001": {}}
         r.build_device_states = AsyncMock()
 
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            r.discovery_complete = True
-
-        with patch("govee2mqtt.mixins.refresh.asyncio.sleep", side_effect=mock_sleep):
-            await r.refresh_all_devices()
+        task = asyncio.create_task(r.refresh_all_devices())
+        await asyncio.sleep(0)
+        r.build_device_states.assert_not_called()
 
-        assert call_count == 1
+        r.discovery_complete_event.set()
+        await task
         r.build_device_states.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_excludes_boosted_devices(self):
         r = FakeRefresher()
         r.devices = {"LIGHT001": {}, "LIGHT002": {}, "LIGHT003": {}}
-        r.boosted = ["LIGHT002"]
+        r.boosted = {"LIGHT002"}
         r.build_device_states = AsyncMock()
 
         await r.refresh_all_devices()
@@ -70,13 +81,148 @@ class TestRefreshAllDevices:
 
         assert r.build_device_states.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self):
+        r = FakeRefresher()
+        r.devices = {f"LIGHT{i:03}": {} for i in range(MAX_CONCURRENT_REFRESHES * 2)}
+        in_flight = 0
+        peak = 0
+
+        async def slow_build(device_id, data=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        r.build_device_states = slow_build
+
+        await r.refresh_all_devices()
+
+        assert peak == MAX_CONCURRENT_REFRESHES
+
+
+class TestAdaptiveRefreshInterval:
+    @pytest.mark.asyncio
+    async def test_backs_off_while_idle(self):
+        r = FakeRefresher()
+        r.devices = {"LIGHT001": {}}
+        r.build_device_states = AsyncMock()
+
+        for expected in (60, 120, 120):
+            # pretend the backed-off interval has passed
+            r.device_next_refresh.clear()
+            await r.refresh_all_devices()
+            assert r.get_device_refresh_interval("LIGHT001") == expected
+
+    @pytest.mark.asyncio
+    async def test_resets_on_change(self):
+        r = FakeRefresher()
+        r.devices = {"LIGHT001": {}, "LIGHT002": {}}
+        r.device_idle_cycles = {"LIGHT001": 3, "LIGHT002": 3}
+        r.build_device_states = AsyncMock()
+        r.get_device_state_messages = MagicMock(side_effect=lambda device_id: [("topic", 1)] if device_id == "LIGHT002" else [])
+
+        await r.refresh_all_devices()
+
+        assert r.device_idle_cycles["LIGHT002"] == 0
+        assert r.get_device_refresh_interval("LIGHT002") == 30
+        # the quiet device keeps its own back-off
+        assert r.get_device_refresh_interval("LIGHT001") == 120
+
+    @pytest.mark.asyncio
+    async def test_skips_devices_not_due(self):
+        r = FakeRefresher()
+        r.devices = {"LIGHT001": {}, "LIGHT002": {}}
+        r.device_next_refresh = {"LIGHT001": time.monotonic() + 60}
+        r.build_device_states = AsyncMock()
+
+        await r.refresh_all_devices()
+
+        r.build_device_states.assert_awaited_once_with("LIGHT002")
+        assert r.device_next_refresh["LIGHT002"] > time.monotonic()
+
+    @pytest.mark.asyncio
+    async def test_changes_publish_as_one_batch(self):
+        r = FakeRefresher()
+        r.devices = {"LIGHT001": {}, "LIGHT002": {}, "LIGHT003": {}}
+        r.build_device_states = AsyncMock()
+        r.get_device_state_messages = MagicMock(side_effect=lambda device_id: [] if device_id == "LIGHT002" else [(device_id, 1)])
+        r.publish_state_messages = AsyncMock()
+
+        await r.refresh_all_devices()
+
+        r.publish_state_messages.assert_awaited_once_with({"LIGHT001": [("LIGHT001", 1)], "LIGHT003": [("LIGHT003", 1)]})
+
+    @pytest.mark.asyncio
+    async def test_failed_device_does_not_block_others(self):
+        r = FakeRefresher()
+        r.devices = {
+            "LIGHT001": {"component": {"device": {"name": "Desk"}}},
+            "LIGHT002": {"component": {"device": {"name": "Porch"}}},
+        }
+
+        async def build(device_id):
+            if device_id == "LIGHT001":
+                raise RuntimeError("boom")
+
+        r.build_device_states = build
+        r.get_device_state_messages = MagicMock(return_value=[("topic", 1)])
+        r.publish_state_messages = AsyncMock()
+
+        await r.refresh_all_devices()
+
+        r.publish_state_messages.assert_awaited_once_with({"LIGHT002": [("topic", 1)]})
+        r.logger.error.assert_called_once()
+        assert "Desk" in r.logger.error.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_device_does_not_block_others(self):
+        r = FakeRefresher()
+        r.devices = {
+            "LIGHT001": {"component": {"device": {"name": "Desk"}}},
+            "LIGHT002": {"component": {"device": {"name": "Porch"}}},
+        }
+
+        async def build(device_id):
+            if device_id == "LIGHT001":
+                raise asyncio.CancelledError()
+
+        r.build_device_states = build
+        r.get_device_state_messages = MagicMock(return_value=[("topic", 1)])
+        r.publish_state_messages = AsyncMock()
+
+        await r.refresh_all_devices()
+
+        r.publish_state_messages.assert_awaited_once_with({"LIGHT002": [("topic", 1)]})
+        r.logger.error.assert_called_once()
+        assert "Desk" in r.logger.error.call_args[0][0]
+
+    @pytest.mark.asyncio
+    async def test_no_publish_when_nothing_changed(self):
+        r = FakeRefresher()
+        r.devices = {"LIGHT001": {}}
+        r.build_device_states = AsyncMock()
+        r.publish_state_messages = AsyncMock()
+
+        await r.refresh_all_devices()
+
+        r.publish_state_messages.assert_not_awaited()
+
+    def test_max_never_below_base_interval(self):
+        r = FakeRefresher()
+        r.device_interval = 300
+        r.device_idle_cycles = {"LIGHT001": 2}
+
+        assert r.get_device_refresh_interval("LIGHT001") == 300
+
 
 class TestRefreshBoostedDevices:
     @pytest.mark.asyncio
     async def test_refreshes_boosted_devices(self):
         r = FakeRefresher()
         r.devices = {"LIGHT001": {}, "LIGHT002": {}}
-        r.boosted = ["LIGHT001"]
+        r.boosted = {"LIGHT001"}
         r.build_device_states = AsyncMock()
 
         await r.refresh_boosted_devices()
@@ -87,7 +233,7 @@ class TestRefreshBoostedDevices:
     async def test_removes_processed_items_from_boosted(self):
         r = FakeRefresher()
         r.devices = {"LIGHT001": {}}
-        r.boosted = ["LIGHT001"]
+        r.boosted = {"LIGHT001"}
         r.build_device_states = AsyncMock()
 
         await r.refresh_boosted_devices()
@@ -95,25 +241,24 @@ class TestRefreshBoostedDevices:
         assert len(r.boosted) == 0
 
     @pytest.mark.asyncio
-    async def test_multi_item_boosted_skips_during_iteration(self):
-        """Exposes list-mutation-during-iteration: only first item is processed."""
+    async def test_multi_item_boosted_all_processed(self):
         r = FakeRefresher()
         r.devices = {"LIGHT001": {}, "LIGHT002": {}}
-        r.boosted = ["LIGHT001", "LIGHT002"]
+        r.boosted = {"LIGHT001", "LIGHT002"}
         r.build_device_states = AsyncMock()
 
         await r.refresh_boosted_devices()
 
-        # Code mutates list during iteration — only LIGHT001 is processed
-        assert r.build_device_states.call_count == 1
-        r.build_device_states.assert_called_once_with("LIGHT001")
-        assert r.boosted == ["LIGHT002"]
+        assert r.build_device_states.call_count == 2
+        called_ids = {c.args[0] for c in r.build_device_states.call_args_list}
+        assert called_ids == {"LIGHT001", "LIGHT002"}
+        assert r.boosted == set()
 
     @pytest.mark.asyncio
     async def test_skips_when_no_boosted(self):
         r = FakeRefresher()
         r.devices = {"LIGHT001": {}}
-        r.boosted = []
+        r.boosted = set()
         r.build_device_states = AsyncMock()
 
         await r.refresh_boosted_devices()
@@ -123,18 +268,14 @@ class TestRefreshBoostedDevices:
     @pytest.mark.asyncio
     async def test_waits_for_discovery_gate(self):
         r = FakeRefresher()
-        r.discovery_complete = False
-        r.boosted = ["LIGHT001"]
+        r.discovery_complete_event.clear()
+        r.boosted = {"LIGHT001"}
         r.build_device_states = AsyncMock()
 
-        call_count = 0
-
-        async def mock_sleep(seconds):
-            nonlocal call_count
-            call_count += 1
-            r.discovery_complete = True
-
-        with patch("govee2mqtt.mixins.refresh.asyncio.sleep", side_effect=mock_sleep):
-            await r.refresh_boosted_devices()
+        task = asyncio.create_task(r.refresh_boosted_devices())
+        await asyncio.sleep(0)
+        r.build_device_states.assert_not_called()
 
-        assert call_count == 1
+        r.discovery_complete_event.set()
+        await task
+        r.build_device_states.assert_called_once_with("LIGHT001")